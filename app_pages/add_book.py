@@ -0,0 +1,70 @@
+import streamlit as st
+from datetime import datetime
+
+from library_manager.covers import submit_cover, convert_image_to_bytes
+from library_manager.books import add_book, get_collections
+
+st.title("➕ Add a New Book")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    title = st.text_input("Title*")
+    author = st.text_input("Author*")
+    genre = st.selectbox("Genre", ["Fiction", "Non-Fiction", "Science Fiction", 
+                                  "Fantasy", "Mystery", "Thriller", "Romance", 
+                                  "Biography", "History", "Self-Help", "Other"])
+    status = st.selectbox("Status", ["Read", "Currently Reading", "To Read", "DNF (Did Not Finish)"])
+    rating = st.slider("Rating", 0, 5, 0)
+
+with col2:
+    total_pages = st.number_input("Total Pages", min_value=0, value=0)
+    pages_read = st.number_input("Pages Read", min_value=0, max_value=total_pages if total_pages > 0 else 0, value=0)
+    isbn = st.text_input("ISBN")
+    publication_year = st.number_input("Publication Year", min_value=1000, max_value=datetime.now().year, value=datetime.now().year)
+    publisher = st.text_input("Publisher")
+
+# Collections
+collections = get_collections()
+selected_collections = []
+if not collections.empty:
+    collection_names = collections['name'].tolist()
+    selected_collections = st.multiselect("Add to Collections", collection_names)
+
+notes = st.text_area("Notes")
+
+# Cover image upload
+st.markdown("**Cover Image**")
+uploaded_file = st.file_uploader("Choose an image...", type=["jpg", "jpeg", "png"])
+if uploaded_file:
+    submit_cover(uploaded_file)
+
+if st.button("Add Book"):
+    if title and author:
+        # Process cover image if uploaded
+        cover_image = convert_image_to_bytes(uploaded_file) if uploaded_file else None
+
+        # Add book to database
+        book_id = add_book(
+            title, 
+            author, 
+            genre, 
+            status, 
+            rating, 
+            notes, 
+            cover_image,
+            total_pages,
+            pages_read if status == "Currently Reading" else (total_pages if status == "Read" else 0),
+            isbn,
+            publication_year,
+            publisher,
+            selected_collections
+        )
+
+        st.success(f"Added '{title}' by {author} to your library!")
+
+        # Clear form
+        st.rerun()
+
+    else:
+        st.error("Title and Author are required fields.")
@@ -0,0 +1,74 @@
+import streamlit as st
+
+from library_manager.covers import get_cover_url
+from library_manager.books import add_collection, get_collections, get_collection_books
+
+st.title("📚 Book Collections")
+
+# Create new collection form
+st.subheader("Create New Collection")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    collection_name = st.text_input("Collection Name*")
+
+with col2:
+    collection_description = st.text_input("Description")
+
+if st.button("Create Collection"):
+    if collection_name:
+        add_collection(collection_name, collection_description)
+        st.success(f"Created new collection: {collection_name}")
+        st.rerun()
+
+    else:
+        st.error("Collection name is required.")
+
+# Display collections
+st.markdown("---")
+st.subheader("Your Collections")
+
+collections = get_collections()
+
+if not collections.empty:
+    for i, collection in collections.iterrows():
+        with st.expander(f"{collection['name']}"):
+            st.markdown(f"**Description:** {collection['description']}")
+            st.markdown(f"**Created on:** {collection['date_created']}")
+
+            # Get books in this collection
+            collection_books = get_collection_books(collection['id'])
+
+            if not collection_books.empty:
+                st.markdown("**Books in this collection:**")
+
+                # Display books in a grid
+                cols = st.columns(3)
+                for j, (_, book) in enumerate(collection_books.iterrows()):
+                    with cols[j % 3]:
+                        st.markdown('<div class="book-card">', unsafe_allow_html=True)
+
+                        # Display cover image if available
+                        if book['has_cover']:
+                            cover_url = get_cover_url(book['id'], book['cover_hash'], "small")
+                            if cover_url:
+                                st.markdown(f'<img src="{cover_url}" style="width:100%; max-width:100px; display:block; margin:0 auto 10px auto;">', unsafe_allow_html=True)
+                        else:
+                            # Display placeholder
+                            st.image("https://via.placeholder.com/100x150?text=No+Cover", width=100)
+
+                        st.markdown(f"**{book['title']}**")
+                        st.markdown(f"by {book['author']}")
+                        st.markdown(f"Rating: {'⭐' * int(book['rating'])}")
+
+                        if st.button("View Details", key=f"coll_view_{collection['id']}_{book['id']}"):
+                            st.session_state['view_book_id'] = book['id']
+                            st.switch_page("app_pages/library.py")
+
+
+                        st.markdown('</div>', unsafe_allow_html=True)
+            else:
+                st.info(f"No books in the '{collection['name']}' collection yet.")
+else:
+    st.info("You haven't created any collections yet.")
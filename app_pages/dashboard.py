@@ -0,0 +1,118 @@
+import streamlit as st
+from datetime import datetime
+
+from library_manager.db import get_db_generation
+from library_manager.covers import get_cover_url
+from library_manager.goals import get_cached_reading_goal
+from library_manager.stats import get_cached_reading_stats
+from library_manager.recommendations import get_cached_book_recommendations
+from library_manager.charts import render_status_chart, render_genre_chart
+
+st.title("📊 Library Dashboard")
+
+# Get statistics
+generation = get_db_generation()
+stats = get_cached_reading_stats(generation)
+current_year = datetime.now().year
+progress = stats.progress
+goal = get_cached_reading_goal(generation, current_year)
+
+# Top row stats
+col1, col2, col3, col4 = st.columns(4)
+
+with col1:
+    st.markdown('<div class="stat-card">', unsafe_allow_html=True)
+    st.markdown(f'<div class="stat-number">{stats.total_books}</div>', unsafe_allow_html=True)
+    st.markdown('Total Books', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+with col2:
+    st.markdown('<div class="stat-card">', unsafe_allow_html=True)
+    read_count = stats.status_counts.get("Read", 0)
+    st.markdown(f'<div class="stat-number">{read_count}</div>', unsafe_allow_html=True)
+    st.markdown('Books Read', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+with col3:
+    st.markdown('<div class="stat-card">', unsafe_allow_html=True)
+    st.markdown(f'<div class="stat-number">{stats.avg_rating:.1f}</div>', unsafe_allow_html=True)
+    st.markdown('Average Rating', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+with col4:
+    st.markdown('<div class="stat-card">', unsafe_allow_html=True)
+    st.markdown(f'<div class="stat-number">{stats.reading_velocity:.1f}</div>', unsafe_allow_html=True)
+    st.markdown('Books/Month', unsafe_allow_html=True)
+    st.markdown('</div>', unsafe_allow_html=True)
+
+st.markdown("---")
+
+# Reading goal progress
+if goal:
+    st.subheader(f"📈 {current_year} Reading Goal Progress")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown('<div class="goal-card">', unsafe_allow_html=True)
+        books_progress = min(100, int((progress.books_read / goal["target_books"]) * 100)) if goal["target_books"] > 0 else 0
+        st.markdown(f"**Books Goal:** {progress.books_read} of {goal['target_books']} ({books_progress}%)")
+        st.progress(books_progress / 100)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown('<div class="goal-card">', unsafe_allow_html=True)
+        pages_progress = min(100, int((progress.pages_read / goal["target_pages"]) * 100)) if goal["target_pages"] > 0 else 0
+        st.markdown(f"**Pages Goal:** {progress.pages_read} of {goal['target_pages']} ({pages_progress}%)")
+        st.progress(pages_progress / 100)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+# Book recommendations
+st.markdown("---")
+st.subheader("📚 Recommended Next Reads")
+
+recommendations = get_cached_book_recommendations(generation)
+
+if recommendations:
+    cols = st.columns(len(recommendations))
+    for i, book in enumerate(recommendations):
+        with cols[i]:
+            st.markdown('<div class="book-card">', unsafe_allow_html=True)
+
+            # Display cover image if available
+            if book['has_cover']:
+                cover_url = get_cover_url(book['id'], book['cover_hash'])
+                if cover_url:
+                    st.markdown(f'<img src="{cover_url}" style="width:100%; max-width:150px; display:block; margin:0 auto 10px auto;">', unsafe_allow_html=True)
+            else:
+                # Display placeholder
+                st.image("https://via.placeholder.com/150x200?text=No+Cover", width=150)
+
+            st.markdown(f"**{book['title']}**")
+            st.markdown(f"by {book['author']}")
+            st.markdown(f"Genre: {book['genre']}")
+            st.markdown('</div>', unsafe_allow_html=True)
+else:
+    st.info("Add more books to your library to get personalized recommendations!")
+
+# Charts
+st.markdown("---")
+st.subheader("📊 Library Insights")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    # Status distribution pie chart
+    if stats.status_counts:
+        st.image(render_status_chart(tuple(stats.status_counts), tuple(stats.status_counts.values())),
+                 use_container_width=True)
+    else:
+        st.info("Add books to see status distribution")
+
+with col2:
+    # Genre distribution bar chart
+    if stats.genre_counts:
+        st.image(render_genre_chart(tuple(stats.genre_counts), tuple(stats.genre_counts.values())),
+                 use_container_width=True)
+    else:
+        st.info("Add books to see genre distribution")
@@ -0,0 +1,82 @@
+import time
+import streamlit as st
+from datetime import datetime
+import os
+import tempfile
+
+from library_manager.transfer import (
+    export_library_archive, IMPORT_DUPLICATE_MODES, bulk_import_books, COLUMNAR_FORMATS,
+    export_library_columnar, open_book_import,
+)
+
+st.title("📤 Import/Export Library")
+
+st.subheader("Export Library")
+st.markdown("Download your whole library, covers included, as a ZIP archive, or a columnar "
+            "snapshot of the books, wishlist, loans and reading history for analysis.")
+
+export_format = st.selectbox("Format", [None, *COLUMNAR_FORMATS],
+                             format_func=lambda f: COLUMNAR_FORMATS.get(f, "ZIP archive (JSON with covers)"))
+
+if st.button("Export Library Data"):
+    # The archive is written to a temporary file, removed once download_button
+    # has read it
+    with tempfile.NamedTemporaryFile(prefix="library_export_", suffix=".zip", delete=False) as export_file:
+        export_path = export_file.name
+    try:
+        with st.spinner("Exporting library..."):
+            if export_format:
+                export_counts = export_library_columnar(export_path, export_format)
+            else:
+                export_counts = export_library_archive(export_path)
+
+        st.caption(f"{export_counts['books']:,} books"
+                   + (f", {export_counts['covers']:,} covers" if "covers" in export_counts else "")
+                   + f", {os.path.getsize(export_path) / 1024 ** 2:,.1f} MB")
+        export_suffix = f"_{export_format}" if export_format else ""
+        export_filename = f"library_export_{datetime.now().strftime('%Y%m%d')}{export_suffix}.zip"
+        with open(export_path, "rb") as export_file:
+            st.download_button("Download Export File", export_file, file_name=export_filename,
+                               mime="application/zip")
+    finally:
+        os.remove(export_path)
+
+st.markdown("---")
+st.subheader("Import Library")
+st.markdown("Books already in your library are matched by ISBN or by title and author.")
+
+duplicate_mode = st.radio("Duplicates", list(IMPORT_DUPLICATE_MODES), index=1, horizontal=True)
+if IMPORT_DUPLICATE_MODES[duplicate_mode] is None:
+    st.markdown("⚠️ **Warning:** Importing will not overwrite existing books, but may create duplicates.")
+
+uploaded_file = st.file_uploader("Upload an export file (ZIP archive, JSON, Parquet or Arrow)",
+                                 type=["zip", "json", *COLUMNAR_FORMATS])
+
+if uploaded_file is not None:
+    if st.button("Import Data"):
+        progress_bar = st.progress(0.0, text="Importing books...")
+        started = time.perf_counter()
+
+        try:
+            import_books, import_fraction = open_book_import(uploaded_file.name, uploaded_file, uploaded_file.size)
+
+            def report_import_progress(processed):
+                rate = processed / max(time.perf_counter() - started, 1e-6)
+                progress_bar.progress(import_fraction(processed),
+                                      text=f"Processed {processed:,} books ({rate:,.0f} rows/s)")
+
+            import_result = bulk_import_books(import_books,
+                                              on_batch=report_import_progress,
+                                              on_duplicate=IMPORT_DUPLICATE_MODES[duplicate_mode])
+        except KeyError:
+            st.error("Invalid import file format. No books found.")
+        except Exception as e:
+            st.error(f"Error importing data: {e}")
+        else:
+            elapsed = time.perf_counter() - started
+            progress_bar.progress(1.0, text="Import complete")
+            st.success(f"Successfully imported {import_result.imported:,} books in {elapsed:.1f}s "
+                       f"({import_result.processed / max(elapsed, 1e-6):,.0f} rows/s)!")
+            if import_result.skipped or import_result.merged:
+                st.info(f"{import_result.skipped:,} duplicates skipped, "
+                        f"{import_result.merged:,} merged into existing books.")
@@ -0,0 +1,339 @@
+import streamlit as st
+from datetime import datetime
+
+from library_manager.covers import submit_cover, convert_image_to_bytes, get_cover_urls, get_cover_url
+from library_manager.books import (
+    get_book, LIBRARY_PAGE_SIZES, LIBRARY_FILTERS, LIBRARY_SORT_ORDERS, build_library_query,
+    library_has_books, get_book_field_values, count_books, get_books_page, update_book, delete_book,
+    get_collections, get_book_collections,
+)
+from library_manager.loans import add_loan
+from library_manager.similarity import SIMILAR_BOOKS_COUNT, get_similar_books
+
+st.title("📖 My Library")
+
+if library_has_books():
+    # Add filter options
+    st.subheader("Filter Books")
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        filter_option = st.selectbox("Filter by", ["None", *LIBRARY_FILTERS])
+
+    filter_value = None
+    if filter_option != "None":
+        with col2:
+            if filter_option == "Genre":
+                unique_genres = get_book_field_values("genre")
+                filter_value = st.selectbox("Select Genre", unique_genres)
+            elif filter_option == "Status":
+                unique_statuses = get_book_field_values("status")
+                filter_value = st.selectbox("Select Status", unique_statuses)
+            elif filter_option == "Rating":
+                filter_value = st.slider("Minimum Rating", 0, 5, 0)
+            elif filter_option == "Collection":
+                collections = get_collections()
+                if not collections.empty:
+                    collection_names = collections['name'].tolist()
+                    filter_value = st.selectbox("Select Collection", collection_names)
+
+    with col3:
+        sort_by = st.selectbox("Sort by", list(LIBRARY_SORT_ORDERS))
+
+    # Filter and sort in SQL
+    where, params, order_by = build_library_query(filter_option, filter_value, sort_by)
+
+    # Display books in a grid
+    st.subheader("Book Collection")
+
+    # Pagination
+    total_books = count_books(where, params)
+    col1, col2, col3 = st.columns([1, 1, 2])
+    with col1:
+        page_size = st.selectbox("Books per page", LIBRARY_PAGE_SIZES)
+    page_count = max(1, -(-total_books // page_size))
+    # Go back to the first page when the filter, sort or page size changes
+    library_view = (filter_option, filter_value, sort_by, page_size)
+    if st.session_state.get('library_view') != library_view:
+        st.session_state['library_view'] = library_view
+        st.session_state['library_page'] = 1
+    st.session_state['library_page'] = min(st.session_state.get('library_page', 1), page_count)
+    with col2:
+        page_number = st.number_input("Page", min_value=1, max_value=page_count, key='library_page')
+    offset = (page_number - 1) * page_size
+    with col3:
+        if total_books:
+            st.markdown(f"Showing {offset + 1}–{min(offset + page_size, total_books)} of {total_books} books")
+
+    filtered_books = get_books_page(where, params, order_by, page_size, offset)
+
+    # Create rows of 3 books each
+    for i in range(0, len(filtered_books), 3):
+        cols = st.columns(3)
+        row_books = filtered_books.iloc[i:i + 3]
+        # Resolve cover URLs for this row only
+        row_cover_urls = get_cover_urls(row_books['id'], row_books['cover_hash'])
+        row_collections = get_book_collections(row_books['id'])
+        for j in range(3):
+            if i + j < len(filtered_books):
+                book = filtered_books.iloc[i + j]
+                with cols[j]:
+                    st.markdown('<div class="book-card">', unsafe_allow_html=True)
+
+                    # Display cover image if available
+                    if book['has_cover']:
+                        cover_url = row_cover_urls.get(book['id'])
+                        if cover_url:
+                            st.markdown(f'<img src="{cover_url}" style="width:100%; max-width:150px; display:block; margin:0 auto 10px auto;">', unsafe_allow_html=True)
+                    else:
+                        # Display placeholder
+                        st.image("https://via.placeholder.com/150x200?text=No+Cover", width=150)
+
+                    # Book details
+                    st.markdown(f"**{book['title']}**")
+                    st.markdown(f"by {book['author']}")
+
+                    # Reading progress
+                    if book['total_pages'] and book['pages_read'] is not None:
+                        progress_pct = min(100, int((book['pages_read'] / book['total_pages']) * 100))
+                        st.progress(progress_pct / 100)
+                        st.markdown(f"Progress: {book['pages_read']}/{book['total_pages']} pages ({progress_pct}%)")
+
+                    # Rating
+                    st.markdown(f"Rating: {'⭐' * int(book['rating'])}")
+
+                    # Status badge
+                    status_colors = {
+                        "Read": "#4CAF50",
+                        "Currently Reading": "#2196F3",
+                        "To Read": "#FFC107",
+                        "DNF (Did Not Finish)": "#F44336"
+                    }
+                    status_color = status_colors.get(book['status'], "#1E3A8A")
+                    st.markdown(f'<span style="background-color:{status_color}; color:white; padding:3px 8px; border-radius:4px;">{book["status"]}</span>', unsafe_allow_html=True)
+
+                    # Collections badges
+                    collections_list = row_collections.get(book['id'], [])
+                    if collections_list:
+                        st.markdown("**Collections:**")
+                        for collection in collections_list:
+                            st.markdown(f'<span class="collection-badge">{collection}</span>', unsafe_allow_html=True)
+
+                    # Action buttons
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        if st.button("View Details", key=f"view_{book['id']}"):
+                            st.session_state['view_book_id'] = book['id']
+                    with col2:
+                        if st.button("Edit", key=f"edit_{book['id']}"):
+                            st.session_state['edit_book_id'] = book['id']
+                            st.session_state['edit_title'] = book['title']
+                            st.session_state['edit_author'] = book['author']
+                            st.session_state['edit_genre'] = book['genre']
+                            st.session_state['edit_status'] = book['status']
+                            st.session_state['edit_rating'] = book['rating']
+                            st.session_state['edit_notes'] = book['notes']
+                            st.session_state['edit_total_pages'] = book['total_pages']
+                            st.session_state['edit_pages_read'] = book['pages_read']
+                            st.session_state['edit_isbn'] = book['isbn']
+                            st.session_state['edit_publication_year'] = book['publication_year']
+                            st.session_state['edit_publisher'] = book['publisher']
+                            st.session_state['edit_collections'] = collections_list
+
+                    st.markdown('</div>', unsafe_allow_html=True)
+
+    # Book details view
+    book = get_book(st.session_state['view_book_id']) if 'view_book_id' in st.session_state else None
+    if book is not None:
+        book_id = st.session_state['view_book_id']
+
+        st.markdown("---")
+        st.subheader(f"Book Details: {book['title']}")
+
+        col1, col2 = st.columns([1, 2])
+
+        with col1:
+            # Display cover image if available
+            if book['has_cover']:
+                cover_url = get_cover_url(book_id, book['cover_hash'], "large")
+                if cover_url:
+                    st.markdown(f'<img src="{cover_url}" style="width:100%; max-width:200px;">', unsafe_allow_html=True)
+            else:
+                # Display placeholder
+                st.image("https://via.placeholder.com/200x300?text=No+Cover", width=200)
+
+            # Loan button
+            if st.button("Loan This Book"):
+                st.session_state['loan_book_id'] = book_id
+                st.session_state['loan_book_title'] = book['title']
+
+        with col2:
+            st.markdown(f"**Title:** {book['title']}")
+            st.markdown(f"**Author:** {book['author']}")
+            st.markdown(f"**Genre:** {book['genre']}")
+            st.markdown(f"**Status:** {book['status']}")
+            st.markdown(f"**Rating:** {'⭐' * int(book['rating'])}")
+
+            if book['isbn']:
+                st.markdown(f"**ISBN:** {book['isbn']}")
+
+            if book['publication_year']:
+                st.markdown(f"**Publication Year:** {book['publication_year']}")
+
+            if book['publisher']:
+                st.markdown(f"**Publisher:** {book['publisher']}")
+
+            if book['total_pages']:
+                st.markdown(f"**Total Pages:** {book['total_pages']}")
+
+            if book['pages_read'] is not None and book['total_pages']:
+                progress_pct = min(100, int((book['pages_read'] / book['total_pages']) * 100))
+                st.markdown(f"**Reading Progress:** {book['pages_read']}/{book['total_pages']} pages ({progress_pct}%)")
+                st.progress(progress_pct / 100)
+
+            st.markdown(f"**Date Added:** {book['date_added']}")
+
+            # Collections
+            collections_list = get_book_collections([book_id]).get(book_id, [])
+            if collections_list:
+                st.markdown("**Collections:**")
+                for collection in collections_list:
+                    st.markdown(f'<span class="collection-badge">{collection}</span>', unsafe_allow_html=True)
+
+            # Notes
+            if book['notes']:
+                st.markdown("**Notes:**")
+                st.markdown(f">{book['notes']}")
+
+            # Close button
+            if st.button("Close Details"):
+                del st.session_state['view_book_id']
+                st.rerun()
+
+        # Similar books
+        similar_books = get_similar_books(book_id)
+        if similar_books:
+            st.markdown("**More like this:**")
+            similar_cols = st.columns(SIMILAR_BOOKS_COUNT)
+            for similar_col, similar_book in zip(similar_cols, similar_books):
+                with similar_col:
+                    st.markdown(f"**{similar_book['title']}**  \nby {similar_book['author']}")
+                    if st.button("View Details", key=f"similar_{similar_book['id']}"):
+                        st.session_state['view_book_id'] = similar_book['id']
+                        st.rerun()
+
+
+    # Loan book form
+    if 'loan_book_id' in st.session_state:
+        st.markdown("---")
+        st.subheader(f"Loan Book: {st.session_state['loan_book_title']}")
+
+        borrower_name = st.text_input("Borrower Name")
+        expected_return_date = st.date_input("Expected Return Date")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Confirm Loan"):
+                if borrower_name:
+                    add_loan(
+                        st.session_state['loan_book_id'],
+                        borrower_name,
+                        expected_return_date.strftime("%Y-%m-%d")
+                    )
+                    st.success(f"Book loaned to {borrower_name}")
+                    del st.session_state['loan_book_id']
+                    del st.session_state['loan_book_title']
+                    st.rerun()
+
+                else:
+                    st.error("Please enter borrower name")
+
+        with col2:
+            if st.button("Cancel Loan"):
+                del st.session_state['loan_book_id']
+                del st.session_state['loan_book_title']
+                st.rerun()
+
+
+    # Edit book form
+    if 'edit_book_id' in st.session_state:
+        st.markdown("---")
+        st.subheader("Edit Book")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            edit_title = st.text_input("Title", st.session_state['edit_title'])
+            edit_author = st.text_input("Author", st.session_state['edit_author'])
+            edit_genre = st.selectbox("Genre", ["Fiction", "Non-Fiction", "Science Fiction", 
+                                              "Fantasy", "Mystery", "Thriller", "Romance", 
+                                              "Biography", "History", "Self-Help", "Other"],
+                                     index=["Fiction", "Non-Fiction", "Science Fiction", 
+                                           "Fantasy", "Mystery", "Thriller", "Romance", 
+                                           "Biography", "History", "Self-Help", "Other"].index(st.session_state['edit_genre']))
+            edit_status = st.selectbox("Status", ["Read", "Currently Reading", "To Read", "DNF (Did Not Finish)"],
+                                     index=["Read", "Currently Reading", "To Read", "DNF (Did Not Finish)"].index(st.session_state['edit_status']))
+            edit_rating = st.slider("Rating", 0, 5, int(st.session_state['edit_rating']))
+
+        with col2:
+            edit_total_pages = st.number_input("Total Pages", min_value=0, value=st.session_state['edit_total_pages'] if st.session_state['edit_total_pages'] else 0)
+            edit_pages_read = st.number_input("Pages Read", min_value=0, max_value=edit_total_pages, value=st.session_state['edit_pages_read'] if st.session_state['edit_pages_read'] else 0)
+            edit_isbn = st.text_input("ISBN", st.session_state['edit_isbn'] if st.session_state['edit_isbn'] else "")
+            edit_publication_year = st.number_input("Publication Year", min_value=1000, max_value=datetime.now().year, value=st.session_state['edit_publication_year'] if st.session_state['edit_publication_year'] else 2000)
+            edit_publisher = st.text_input("Publisher", st.session_state['edit_publisher'] if st.session_state['edit_publisher'] else "")
+
+        # Collections
+        collections = get_collections()
+        if not collections.empty:
+            collection_names = collections['name'].tolist()
+            edit_collections = st.multiselect("Collections", collection_names, default=st.session_state['edit_collections'])
+        else:
+            edit_collections = []
+
+        edit_notes = st.text_area("Notes", st.session_state['edit_notes'] if st.session_state['edit_notes'] else "")
+
+        # Cover image upload
+        st.markdown("**Cover Image** (Leave empty to keep current image)")
+        uploaded_file = st.file_uploader("Choose an image...", type=["jpg", "jpeg", "png"])
+        if uploaded_file:
+            submit_cover(uploaded_file)
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            if st.button("Save Changes"):
+                update_book(
+                    st.session_state['edit_book_id'], 
+                    edit_title, 
+                    edit_author, 
+                    edit_genre, 
+                    edit_status, 
+                    edit_rating, 
+                    edit_notes,
+                    convert_image_to_bytes(uploaded_file) if uploaded_file else None,
+                    edit_total_pages,
+                    edit_pages_read,
+                    edit_isbn,
+                    edit_publication_year,
+                    edit_publisher,
+                    edit_collections
+                )
+                st.success("Book updated successfully!")
+                del st.session_state['edit_book_id']
+                st.rerun()
+
+
+        with col2:
+            if st.button("Cancel"):
+                del st.session_state['edit_book_id']
+                st.rerun()
+
+
+        with col3:
+            if st.button("Delete Book"):
+                delete_book(st.session_state['edit_book_id'])
+                st.success("Book deleted successfully!")
+                del st.session_state['edit_book_id']
+                st.rerun()
+
+else:
+    st.info("Your library is empty. Add some books to get started!")
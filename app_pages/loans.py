@@ -0,0 +1,59 @@
+import streamlit as st
+from datetime import datetime
+
+from library_manager.loans import get_loans, mark_as_returned
+
+st.title("🤝 Book Loan Tracker")
+
+# Display active loans
+st.subheader("Active Loans")
+
+loans = get_loans(include_returned=False)
+
+if not loans.empty:
+    for i, loan in loans.iterrows():
+        st.markdown(f'<div class="loan-card">', unsafe_allow_html=True)
+        col1, col2 = st.columns([3, 1])
+
+        with col1:
+            st.markdown(f"**{loan['title']}** by {loan['author']}")
+            st.markdown(f"Borrowed by: **{loan['borrower_name']}**")
+            st.markdown(f"Loaned on: {loan['date_loaned']}")
+            st.markdown(f"Expected return: {loan['expected_return_date']}")
+
+            # Check if overdue
+            expected_date = datetime.strptime(loan['expected_return_date'], "%Y-%m-%d")
+            if expected_date < datetime.now():
+                st.markdown(f'<span style="color:#F44336; font-weight:bold;">OVERDUE</span>', unsafe_allow_html=True)
+
+        with col2:
+            if st.button("Mark as Returned", key=f"return_{loan['id']}"):
+                mark_as_returned(loan['id'])
+                st.success(f"Marked '{loan['title']}' as returned!")
+                st.rerun()
+
+
+        st.markdown('</div>', unsafe_allow_html=True)
+else:
+    st.info("No active loans. All your books are safe at home!")
+
+# Show loan history
+show_history = st.checkbox("Show Loan History")
+
+if show_history:
+    st.subheader("Loan History")
+
+    history = get_loans(include_returned=True)
+    returned_loans = history[history['returned'] == 1]
+
+    if not returned_loans.empty:
+        for i, loan in returned_loans.iterrows():
+            st.markdown(f'<div style="background-color:#f0f2f6; border-radius:8px; padding:1rem; margin-bottom:0.5rem; border-left:4px solid #4CAF50;">', unsafe_allow_html=True)
+            st.markdown(f"**{loan['title']}** by {loan['author']}")
+            st.markdown(f"Borrowed by: {loan['borrower_name']}")
+            st.markdown(f"Loaned on: {loan['date_loaned']}")
+            st.markdown(f"Expected return: {loan['expected_return_date']}")
+            st.markdown(f'<span style="color:#4CAF50; font-weight:bold;">RETURNED</span>', unsafe_allow_html=True)
+            st.markdown('</div>', unsafe_allow_html=True)
+    else:
+        st.info("No loan history yet.")
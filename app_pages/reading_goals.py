@@ -0,0 +1,134 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+
+from library_manager.db import get_db_generation
+from library_manager.goals import (
+    set_reading_goal, get_reading_goal, compute_reading_pace, get_cached_reading_history_summary,
+    get_cached_reading_goals,
+)
+
+st.title("🎯 Reading Goals")
+
+current_year = datetime.now().year
+selected_year = st.selectbox("Select Year", range(current_year - 5, current_year + 6), index=5)
+
+# Get current goal if exists
+goal = get_reading_goal(selected_year)
+
+# Set up form
+st.subheader(f"Set Reading Goal for {selected_year}")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    target_books = st.number_input(
+        "Target Number of Books", 
+        min_value=1, 
+        value=goal["target_books"] if goal else 12
+    )
+
+with col2:
+    target_pages = st.number_input(
+        "Target Number of Pages", 
+        min_value=1, 
+        value=goal["target_pages"] if goal else 3600
+    )
+
+if st.button("Save Goal"):
+    set_reading_goal(selected_year, target_books, target_pages)
+    st.success(f"Reading goal for {selected_year} saved!")
+
+# Reading history and goals for every year, fetched once for the page
+generation = get_db_generation()
+history = get_cached_reading_history_summary(generation)
+goals = get_cached_reading_goals(generation)
+
+# Show progress if it's the current year
+if goal:
+    st.markdown("---")
+    st.subheader("Current Progress")
+
+    progress = history.progress(selected_year)
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        st.markdown('<div class="goal-card">', unsafe_allow_html=True)
+        books_progress = min(100, int((progress.books_read / goal["target_books"]) * 100)) if goal["target_books"] > 0 else 0
+        st.markdown(f"**Books Goal:** {progress.books_read} of {goal['target_books']} ({books_progress}%)")
+        st.progress(books_progress / 100)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown('<div class="goal-card">', unsafe_allow_html=True)
+        pages_progress = min(100, int((progress.pages_read / goal["target_pages"]) * 100)) if goal["target_pages"] > 0 else 0
+        st.markdown(f"**Pages Goal:** {progress.pages_read} of {goal['target_pages']} ({pages_progress}%)")
+        st.progress(pages_progress / 100)
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Calculate reading pace
+    if selected_year == current_year:
+        pace = compute_reading_pace(
+            [selected_year], [goal["target_books"]], [goal["target_pages"]],
+            [progress.books_read], [progress.pages_read]
+        )
+        books_per_week_needed = pace["books_per_week"][0]
+        pages_per_day_needed = pace["pages_per_day"][0]
+
+        st.markdown("---")
+        st.subheader("Reading Pace")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            st.markdown('<div class="stat-card">', unsafe_allow_html=True)
+            st.markdown(f"To reach your books goal, you need to read:")
+            st.markdown(f'<div class="stat-number">{books_per_week_needed:.1f}</div>', unsafe_allow_html=True)
+            st.markdown("books per week")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        with col2:
+            st.markdown('<div class="stat-card">', unsafe_allow_html=True)
+            st.markdown(f"To reach your pages goal, you need to read:")
+            st.markdown(f'<div class="stat-number">{pages_per_day_needed:.0f}</div>', unsafe_allow_html=True)
+            st.markdown("pages per day")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+    # Books finished per month in the selected year
+    st.markdown("---")
+    st.subheader(f"{selected_year} by Month")
+    month_names = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+    monthly = pd.DataFrame(
+        {"Books finished": history.monthly_books(selected_year)},
+        index=pd.CategoricalIndex(month_names, categories=month_names, ordered=True)
+    )
+    st.bar_chart(monthly)
+
+# Progress against every goal set so far
+if not goals.empty:
+    st.markdown("---")
+    st.subheader("Goal History")
+
+    goal_years = goals["year"].to_numpy()
+    books_read, pages_read = history.yearly_totals(goal_years)
+    pace = compute_reading_pace(
+        goal_years, goals["target_books"].to_numpy(), goals["target_pages"].to_numpy(),
+        books_read, pages_read
+    )
+
+    trend = pd.DataFrame({
+        "Books read": books_read,
+        "Target books": goals["target_books"].to_numpy(),
+    }, index=goal_years.astype(str))
+    st.line_chart(trend)
+
+    st.dataframe(pd.DataFrame({
+        "Year": goal_years,
+        "Books read": books_read,
+        "Target books": goals["target_books"].to_numpy(),
+        "Pages read": pages_read,
+        "Target pages": goals["target_pages"].to_numpy(),
+        "Books/week needed": pace["books_per_week"].round(1),
+        "Pages/day needed": pace["pages_per_day"].round(0),
+    }), hide_index=True)
@@ -0,0 +1,101 @@
+import streamlit as st
+
+from library_manager.covers import get_cover_url
+from library_manager.books import delete_book, get_book_collections
+from library_manager.search import (
+    SEARCH_FIELDS, SEARCH_REFINE_LIMIT, MIN_SEARCH_CHARS, get_search_state, load_more_search_results,
+)
+
+st.title("🔍 Search Books")
+
+search_by = st.selectbox("Search by", list(SEARCH_FIELDS))
+search_term = st.text_input("Enter search term", help='Words match by prefix; use "quotes" for an exact phrase.')
+
+if len(search_term.strip()) >= MIN_SEARCH_CHARS:
+    search_state = get_search_state(search_term, search_by)
+    results = search_state["results"]
+
+    if not results.empty:
+        total = len(search_state["ids"]) if search_state["complete"] else f"{SEARCH_REFINE_LIMIT}+"
+        st.subheader(f"Found {total} results")
+
+        for i, book in results.iterrows():
+            with st.expander(f"{book['title']} by {book['author']}"):
+                col1, col2 = st.columns([1, 3])
+
+                with col1:
+                    # Display cover image if available
+                    if book['has_cover']:
+                        cover_url = get_cover_url(book['id'], book['cover_hash'])
+                        if cover_url:
+                            st.markdown(f'<img src="{cover_url}" style="width:100%; max-width:150px;">', unsafe_allow_html=True)
+                    else:
+                        # Display placeholder
+                        st.image("https://via.placeholder.com/150x200?text=No+Cover", width=150)
+
+                with col2:
+                    st.markdown(f"**Match:** {book['snippet']}")
+                    st.markdown(f"**Genre:** {book['genre']}")
+                    st.markdown(f"**Status:** {book['status']}")
+                    st.markdown(f"**Rating:** {'⭐' * int(book['rating'])}")
+
+                    if book['total_pages']:
+                        st.markdown(f"**Pages:** {book['total_pages']}")
+
+                    if book['publication_year']:
+                        st.markdown(f"**Published:** {book['publication_year']}")
+
+                    if book['isbn']:
+                        st.markdown(f"**ISBN:** {book['isbn']}")
+
+                    st.markdown(f"**Added on:** {book['date_added']}")
+
+                    if book['notes']:
+                        st.markdown("**Notes:**")
+                        st.markdown(f">{book['notes']}")
+
+                    # Action buttons
+                    col1, col2, col3 = st.columns(3)
+                    with col1:
+                        if st.button("View Details", key=f"search_view_{book['id']}"):
+                            st.session_state['view_book_id'] = book['id']
+                            st.switch_page("app_pages/library.py")
+
+
+                    with col2:
+                        if st.button("Edit", key=f"search_edit_{book['id']}"):
+                            st.session_state['edit_book_id'] = book['id']
+                            st.session_state['edit_title'] = book['title']
+                            st.session_state['edit_author'] = book['author']
+                            st.session_state['edit_genre'] = book['genre']
+                            st.session_state['edit_status'] = book['status']
+                            st.session_state['edit_rating'] = book['rating']
+                            st.session_state['edit_notes'] = book['notes']
+                            st.session_state['edit_total_pages'] = book['total_pages']
+                            st.session_state['edit_pages_read'] = book['pages_read']
+                            st.session_state['edit_isbn'] = book['isbn']
+                            st.session_state['edit_publication_year'] = book['publication_year']
+                            st.session_state['edit_publisher'] = book['publisher']
+                            st.session_state['edit_collections'] = get_book_collections([book['id']]).get(book['id'], [])
+                            # The edit form lives on My Library
+                            st.switch_page("app_pages/library.py")
+
+
+                    with col3:
+                        if st.button("Delete", key=f"search_delete_{book['id']}"):
+                            delete_book(book['id'])
+                            st.success(f"Deleted '{book['title']}' from your library!")
+                            st.rerun()
+
+
+        # Fetch the next page after the last result shown
+        if not search_state["done"]:
+            st.caption(f"Showing {len(results)} of {total} results")
+            if st.button("Load more results"):
+                load_more_search_results(search_state)
+                st.rerun()
+
+    else:
+        st.info(f"No books found matching '{search_term}' in {search_by}.")
+elif search_term:
+    st.info(f"Type at least {MIN_SEARCH_CHARS} characters to search.")
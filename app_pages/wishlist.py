@@ -0,0 +1,150 @@
+import streamlit as st
+from datetime import datetime
+
+from library_manager.covers import submit_cover, convert_image_to_bytes
+from library_manager.books import add_book
+from library_manager.wishlist import add_to_wishlist, get_wishlist, delete_from_wishlist
+
+st.title("📋 Book Wishlist")
+
+# Add to wishlist form
+st.subheader("Add to Wishlist")
+
+col1, col2 = st.columns(2)
+
+with col1:
+    wish_title = st.text_input("Title*")
+    wish_author = st.text_input("Author*")
+
+with col2:
+    wish_priority = st.selectbox("Priority", ["High", "Medium", "Low"])
+    wish_notes = st.text_input("Notes")
+
+if st.button("Add to Wishlist"):
+    if wish_title and wish_author:
+        add_to_wishlist(wish_title, wish_author, wish_priority, wish_notes)
+        st.success(f"Added '{wish_title}' to your wishlist!")
+        st.rerun()
+
+    else:
+        st.error("Title and Author are required fields.")
+
+# Display wishlist
+st.markdown("---")
+st.subheader("Your Wishlist")
+
+wishlist = get_wishlist()
+
+if not wishlist.empty:
+    # Sort by priority
+    priority_order = {"High": 0, "Medium": 1, "Low": 2}
+    wishlist['priority_order'] = wishlist['priority'].map(priority_order)
+    wishlist = wishlist.sort_values(by=['priority_order', 'date_added'])
+
+    for i, item in wishlist.iterrows():
+        priority_colors = {"High": "#F44336", "Medium": "#FFC107", "Low": "#4CAF50"}
+        priority_color = priority_colors.get(item['priority'], "#1E3A8A")
+
+        st.markdown(f'<div class="wishlist-item">', unsafe_allow_html=True)
+        col1, col2 = st.columns([3, 1])
+
+        with col1:
+            st.markdown(f"**{item['title']}** by {item['author']}")
+            st.markdown(f'<span style="background-color:{priority_color}; color:white; padding:3px 8px; border-radius:4px;">{item["priority"]} Priority</span>', unsafe_allow_html=True)
+            if item['notes']:
+                st.markdown(f"Note: {item['notes']}")
+            st.markdown(f"Added on: {item['date_added']}")
+
+        with col2:
+            if st.button("Remove", key=f"remove_wish_{item['id']}"):
+                delete_from_wishlist(item['id'])
+                st.success(f"Removed '{item['title']}' from your wishlist!")
+                st.rerun()
+
+
+            if st.button("Add to Library", key=f"add_lib_{item['id']}"):
+                st.session_state['add_from_wishlist'] = True
+                st.session_state['wish_title'] = item['title']
+                st.session_state['wish_author'] = item['author']
+                st.session_state['wish_id'] = item['id']
+                st.rerun()
+
+
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Add from wishlist to library form
+    if 'add_from_wishlist' in st.session_state and st.session_state['add_from_wishlist']:
+        st.markdown("---")
+        st.subheader(f"Add to Library: {st.session_state['wish_title']}")
+
+        col1, col2 = st.columns(2)
+
+        with col1:
+            genre = st.selectbox("Genre", ["Fiction", "Non-Fiction", "Science Fiction", 
+                                        "Fantasy", "Mystery", "Thriller", "Romance", 
+                                        "Biography", "History", "Self-Help", "Other"])
+            status = st.selectbox("Status", ["Read", "Currently Reading", "To Read", "DNF (Did Not Finish)"])
+            rating = st.slider("Rating", 0, 5, 0)
+
+        with col2:
+            total_pages = st.number_input("Total Pages", min_value=0, value=0)
+            isbn = st.text_input("ISBN")
+            publication_year = st.number_input("Publication Year", min_value=1000, max_value=datetime.now().year, value=datetime.now().year)
+
+        notes = st.text_area("Notes")
+
+        # Cover image upload
+        st.markdown("**Cover Image**")
+        uploaded_file = st.file_uploader("Choose an image...", type=["jpg", "jpeg", "png"])
+        if uploaded_file:
+            submit_cover(uploaded_file)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("Add to Library"):
+                # Process cover image if uploaded
+                cover_image = convert_image_to_bytes(uploaded_file) if uploaded_file else None
+
+                # Add book to database
+                add_book(
+                    st.session_state['wish_title'], 
+                    st.session_state['wish_author'], 
+                    genre, 
+
+                    st.session_state['wish_author'],
+                    genre,
+                    status,
+                    rating,
+                    notes,
+                    cover_image,
+                    total_pages,
+                    total_pages if status == "Read" else 0,
+                    isbn,
+                    publication_year,
+                    "",
+                    []
+                )
+
+                # Remove from wishlist
+                delete_from_wishlist(st.session_state['wish_id'])
+
+                st.success(f"Added '{st.session_state['wish_title']}' to your library and removed from wishlist!")
+
+                # Clear form
+                del st.session_state['add_from_wishlist']
+                del st.session_state['wish_title']
+                del st.session_state['wish_author']
+                del st.session_state['wish_id']
+                st.rerun()
+
+
+        with col2:
+            if st.button("Cancel"):
+                del st.session_state['add_from_wishlist']
+                del st.session_state['wish_title']
+                del st.session_state['wish_author']
+                del st.session_state['wish_id']
+                st.rerun()
+
+else:
+    st.info("Your wishlist is empty. Add books you want to read in the future.")
@@ -0,0 +1,2 @@
+# Data access and storage for the Personal Library Manager. The page scripts in
+# app_pages/ import the modules they need directly, so a page only loads what it uses.
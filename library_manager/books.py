@@ -0,0 +1,230 @@
+import pandas as pd
+from datetime import datetime
+
+from .db import db_connection
+from .dedup import DEDUP_KEY_COLUMNS, release_dedup_key, refresh_dedup_keys
+from .covers import store_cover
+from .features import refresh_book_features
+
+# Database operations for books
+def add_book(title, author, genre, status, rating, notes, cover_image, total_pages, pages_read, isbn, publication_year, publisher, collections):
+    with db_connection() as conn:
+        c = conn.cursor()
+        date_added = datetime.now().strftime("%Y-%m-%d")
+
+        # Write the cover to the cover store
+        cover_hash = store_cover(cover_image) if cover_image else None
+
+        c.execute('''
+        INSERT INTO books (title, author, genre, status, rating, date_added, notes, cover_image, cover_hash,
+                          total_pages, pages_read, isbn, publication_year, publisher)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (title, author, genre, status, rating, date_added, notes, cover_image, cover_hash,
+             total_pages, pages_read, isbn, publication_year, publisher))
+
+        book_id = c.lastrowid
+        refresh_dedup_keys(conn, book_id)
+        refresh_book_features(conn, [book_id])
+        set_book_collections(conn, book_id, collections)
+
+        # If status is "Read", add to reading history
+        if status == "Read":
+            c.execute('''
+            INSERT INTO reading_history (book_id, date_started, date_finished)
+            VALUES (?, ?, ?)
+            ''', (book_id, date_added, date_added))
+        # If status is "Currently Reading", add start date
+        elif status == "Currently Reading":
+            c.execute('''
+            INSERT INTO reading_history (book_id, date_started)
+            VALUES (?, ?)
+            ''', (book_id, date_added))
+
+    return book_id
+
+# Columns returned by listing queries. Cover BLOBs are left out and fetched on
+# demand with get_book_covers; has_cover tells the caller whether one exists.
+BOOK_LIST_COLUMNS = """
+    books.id, books.title, books.author, books.genre, books.status, books.rating,
+    books.date_added, books.notes, books.total_pages, books.pages_read, books.isbn,
+    books.publication_year, books.publisher, books.cover_hash,
+    books.cover_image IS NOT NULL AS has_cover
+"""
+
+def get_book(book_id):
+    with db_connection() as conn:
+        book = pd.read_sql_query(f"SELECT {BOOK_LIST_COLUMNS} FROM books WHERE books.id = ?", conn, params=(int(book_id),))
+    return book.iloc[0] if not book.empty else None
+
+# My Library is rendered a page at a time: the filter, sort order and
+# LIMIT/OFFSET go into SQL so only the visible books are fetched
+LIBRARY_PAGE_SIZES = [12, 24, 48]
+
+LIBRARY_FILTERS = {
+    "Genre": "books.genre = ?",
+    "Status": "books.status = ?",
+    "Rating": "books.rating >= ?",
+    "Collection": '''EXISTS (
+        SELECT 1 FROM book_collections bc
+        JOIN collections c ON c.id = bc.collection_id
+        WHERE bc.book_id = books.id AND c.name = ?
+    )''',
+}
+
+# books.id breaks ties so paging through equal keys is stable; it runs in the same
+# direction as the sort key so the single-column indexes give the order directly
+LIBRARY_SORT_ORDERS = {
+    "Title": "books.title, books.id",
+    "Author": "books.author, books.id",
+    "Date Added": "books.date_added DESC, books.id DESC",
+    "Rating": "books.rating DESC, books.id DESC",
+    "Publication Year": "books.publication_year DESC, books.id DESC",
+}
+
+def build_library_query(filter_option, filter_value, sort_by):
+    # Turn the My Library filter and sort choices into (where, params, order_by)
+    where, params = "", ()
+    if filter_option in LIBRARY_FILTERS and filter_value is not None:
+        where, params = f"WHERE {LIBRARY_FILTERS[filter_option]}", (filter_value,)
+    return where, params, LIBRARY_SORT_ORDERS.get(sort_by, LIBRARY_SORT_ORDERS["Title"])
+
+def library_has_books():
+    with db_connection() as conn:
+        return conn.execute("SELECT EXISTS (SELECT 1 FROM books)").fetchone()[0] == 1
+
+def get_book_field_values(column):
+    # Distinct non-empty values of a books column, for filter choices
+    with db_connection() as conn:
+        rows = conn.execute(f"SELECT DISTINCT {column} FROM books WHERE {column} IS NOT NULL ORDER BY {column}").fetchall()
+    return [row[0] for row in rows]
+
+def count_books(where="", params=()):
+    with db_connection() as conn:
+        return conn.execute(f"SELECT COUNT(*) FROM books {where}", params).fetchone()[0]
+
+def get_books_page(where="", params=(), order_by="books.title", limit=LIBRARY_PAGE_SIZES[0], offset=0):
+    with db_connection() as conn:
+        return pd.read_sql_query(
+            f"SELECT {BOOK_LIST_COLUMNS} FROM books {where} ORDER BY {order_by} LIMIT ? OFFSET ?",
+            conn,
+            params=(*params, limit, offset)
+        )
+
+def update_book(book_id, title, author, genre, status, rating, notes, cover_image, total_pages, pages_read, isbn, publication_year, publisher, collections):
+    with db_connection() as conn:
+        c = conn.cursor()
+
+        # Get current book status
+        c.execute("SELECT status FROM books WHERE id = ?", (book_id,))
+        current_status = c.fetchone()[0]
+
+        # Write a new cover to the cover store
+        cover_hash = store_cover(cover_image) if cover_image else None
+
+        c.execute('''
+        UPDATE books
+        SET title = ?, author = ?, genre = ?, status = ?, rating = ?, notes = ?,
+            cover_image = COALESCE(?, cover_image), cover_hash = COALESCE(?, cover_hash),
+            total_pages = ?, pages_read = ?, isbn = ?, publication_year = ?, publisher = ?
+        WHERE id = ?
+        ''', (title, author, genre, status, rating, notes, cover_image, cover_hash,
+             total_pages, pages_read, isbn, publication_year, publisher, book_id))
+        refresh_dedup_keys(conn, book_id)
+        refresh_book_features(conn, [book_id])
+        set_book_collections(conn, book_id, collections)
+
+        # Update reading history if status changed
+        if current_status != status:
+            if status == "Read" and current_status == "Currently Reading":
+                # Book finished - update with finish date
+                c.execute('''
+                UPDATE reading_history
+                SET date_finished = ?
+                WHERE book_id = ? AND date_finished IS NULL
+                ''', (datetime.now().strftime("%Y-%m-%d"), book_id))
+            elif status == "Currently Reading" and current_status != "Currently Reading":
+                # Started reading - add to history
+                c.execute('''
+                INSERT INTO reading_history (book_id, date_started)
+                VALUES (?, ?)
+                ''', (book_id, datetime.now().strftime("%Y-%m-%d")))
+
+def delete_book(book_id):
+    with db_connection() as conn:
+        c = conn.cursor()
+
+        # Delete related reading history
+        c.execute("DELETE FROM reading_history WHERE book_id = ?", (book_id,))
+
+        # Delete related loans
+        c.execute("DELETE FROM loans WHERE book_id = ?", (book_id,))
+
+        # Delete collection memberships
+        c.execute("DELETE FROM book_collections WHERE book_id = ?", (book_id,))
+
+        # Delete the book, passing any duplicate detection keys it held to the next copy
+        c.execute("SELECT isbn_key, title_author_key FROM books WHERE id = ?", (book_id,))
+        keys = c.fetchone()
+        c.execute("DELETE FROM books WHERE id = ?", (book_id,))
+        if keys:
+            for column, key in zip(DEDUP_KEY_COLUMNS, keys):
+                if key is not None:
+                    release_dedup_key(conn, book_id, column, key)
+
+# Collection operations
+def add_collection(name, description):
+    with db_connection() as conn:
+        c = conn.cursor()
+        date_created = datetime.now().strftime("%Y-%m-%d")
+
+        c.execute('''
+        INSERT INTO collections (name, description, date_created)
+        VALUES (?, ?, ?)
+        ''', (name, description, date_created))
+
+def get_collections():
+    with db_connection() as conn:
+        return pd.read_sql_query("SELECT * FROM collections", conn)
+
+def set_book_collections(conn, book_id, collection_names):
+    # Replace a book's memberships with the named collections
+    conn.execute("DELETE FROM book_collections WHERE book_id = ?", (book_id,))
+    collection_names = list(collection_names or [])
+    if collection_names:
+        placeholders = ", ".join("?" * len(collection_names))
+        conn.execute(f'''
+        INSERT OR IGNORE INTO book_collections (book_id, collection_id)
+        SELECT ?, id FROM collections WHERE name IN ({placeholders})
+        ''', (book_id, *collection_names))
+
+def get_book_collections(book_ids=None):
+    # Collection names keyed by book id, for a batch of books or (None) all of them
+    where, params = "", []
+    if book_ids is not None:
+        params = [int(book_id) for book_id in book_ids]
+        if not params:
+            return {}
+        where = f"WHERE bc.book_id IN ({', '.join('?' * len(params))})"
+    with db_connection() as conn:
+        rows = conn.execute(f'''
+        SELECT bc.book_id, c.name
+        FROM book_collections bc
+        JOIN collections c ON c.id = bc.collection_id
+        {where}
+        ORDER BY c.name
+        ''', params).fetchall()
+
+    book_collections = {}
+    for book_id, name in rows:
+        book_collections.setdefault(book_id, []).append(name)
+    return book_collections
+
+def get_collection_books(collection_id):
+    with db_connection() as conn:
+        return pd.read_sql_query(f'''
+        SELECT {BOOK_LIST_COLUMNS}
+        FROM book_collections bc
+        JOIN books ON books.id = bc.book_id
+        WHERE bc.collection_id = ?
+        ORDER BY books.title
+        ''', conn, params=(int(collection_id),))
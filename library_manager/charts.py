@@ -0,0 +1,40 @@
+import streamlit as st
+from io import BytesIO
+
+from .startup import lazy_import
+
+# Dashboard charts. Each is rasterized once per distinct set of values and the
+# PNG bytes are cached, so reruns with unchanged data draw nothing. Figures are
+# built with matplotlib's Figure class rather than pyplot, so no global figure
+# registry holds on to them and sessions rendering at once do not share state.
+CHART_FIGSIZE = (8, 8)
+CHART_DPI = 100
+
+def render_chart_png(draw):
+    fig = lazy_import("matplotlib.figure").Figure(figsize=CHART_FIGSIZE, dpi=CHART_DPI)
+    draw(fig.subplots())
+    buffered = BytesIO()
+    fig.savefig(buffered, format="png", bbox_inches="tight")
+    return buffered.getvalue()
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def render_status_chart(labels, values):
+    def draw(ax):
+        ax.pie(
+            values,
+            labels=labels,
+            autopct='%1.1f%%',
+            startangle=90,
+            colors=['#4CAF50', '#2196F3', '#FFC107', '#F44336']
+        )
+        ax.axis('equal')
+        ax.set_title("Books by Reading Status")
+    return render_chart_png(draw)
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def render_genre_chart(labels, values):
+    def draw(ax):
+        ax.barh(labels, values, color='#1E3A8A')
+        ax.set_title("Top Genres in Your Library")
+        ax.set_xlabel("Number of Books")
+    return render_chart_png(draw)
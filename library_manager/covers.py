@@ -0,0 +1,160 @@
+import streamlit as st
+import os
+from io import BytesIO
+import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+from .startup import lazy_import
+from .db import db_connection
+
+# Image handling functions
+COVER_MAX_SIZE = (300, 450)
+COVER_JPEG_QUALITY = 80
+COVER_WORKERS = min(4, os.cpu_count() or 1)
+
+def process_cover(image_bytes):
+    # Downscale and JPEG-encode a cover image. JPEGs are decoded with draft() at the
+    # smallest scale that still covers COVER_MAX_SIZE, which skips most of the decode;
+    # ones that are already cover-sized are kept as they are.
+    image = lazy_import("PIL.Image").open(BytesIO(image_bytes))
+    if image.format == "JPEG" and image.width <= COVER_MAX_SIZE[0] and image.height <= COVER_MAX_SIZE[1]:
+        return image_bytes
+    image.draft("RGB", COVER_MAX_SIZE)
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    image.thumbnail(COVER_MAX_SIZE)
+
+    buffered = BytesIO()
+    image.save(buffered, format="JPEG", quality=COVER_JPEG_QUALITY)
+    return buffered.getvalue()
+
+# Covers are processed on a shared worker pool so an upload starts converting as
+# soon as it arrives and imports convert a batch of covers at once. Pillow
+# releases the GIL while decoding, resizing and encoding, so threads run in parallel.
+@st.cache_resource
+def get_cover_pool():
+    return ThreadPoolExecutor(max_workers=COVER_WORKERS, thread_name_prefix="cover")
+
+def submit_cover(uploaded_file):
+    # Future for an uploaded cover's processed bytes; reruns reuse the same future
+    futures = st.session_state.setdefault("cover_futures", {})
+    if uploaded_file.file_id not in futures:
+        futures[uploaded_file.file_id] = get_cover_pool().submit(process_cover, uploaded_file.getvalue())
+        # Only the most recent uploads are kept
+        while len(futures) > 8:
+            futures.pop(next(iter(futures)))
+    return futures[uploaded_file.file_id]
+
+def convert_image_to_bytes(uploaded_file):
+    if uploaded_file is not None:
+        try:
+            return submit_cover(uploaded_file).result()
+        except Exception as e:
+            st.error(f"Error processing image: {e}")
+            return None
+    return None
+
+# Cover store: each cover is written once to a file named by its content hash
+# under static/covers and served by Streamlit's static file server, so the
+# browser can cache it across reruns and sessions
+COVER_STORE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "static", "covers")
+COVER_URL_PREFIX = "app/static/covers"
+
+def hash_cover(image_bytes):
+    return hashlib.sha256(image_bytes).hexdigest()
+
+# Pages show covers through WebP renditions sized for each view, made from the
+# stored JPEG the first time they are asked for. The JPEG stays the master copy.
+COVER_RENDITIONS = {
+    "small": (100, 150),   # collections
+    "medium": (160, 240),  # library grid, dashboard and search results
+    "large": (300, 450),   # book details
+}
+COVER_WEBP_QUALITY = 75
+
+def cover_path(cover_hash):
+    return os.path.join(COVER_STORE_DIR, f"{cover_hash}.jpg")
+
+def cover_rendition_name(cover_hash, rendition):
+    return f"{cover_hash}_{rendition}.webp"
+
+def write_cover_file(path, data):
+    os.makedirs(COVER_STORE_DIR, exist_ok=True)
+    # Write to a temporary name first so readers never see a partial file
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def store_cover(image_bytes):
+    cover_hash = hash_cover(image_bytes)
+    path = cover_path(cover_hash)
+    if not os.path.exists(path):
+        write_cover_file(path, image_bytes)
+    return cover_hash
+
+def render_cover(image_bytes, size):
+    # WebP rendition of a cover scaled to fit `size`
+    image = lazy_import("PIL.Image").open(BytesIO(image_bytes))
+    image.draft("RGB", size)
+    if image.mode not in ("RGB", "L"):
+        image = image.convert("RGB")
+    image.thumbnail(size)
+
+    buffered = BytesIO()
+    image.save(buffered, format="WEBP", quality=COVER_WEBP_QUALITY, method=4)
+    return buffered.getvalue()
+
+def store_cover_rendition(cover_hash, rendition):
+    with open(cover_path(cover_hash), "rb") as f:
+        image_bytes = f.read()
+    write_cover_file(os.path.join(COVER_STORE_DIR, cover_rendition_name(cover_hash, rendition)),
+                     render_cover(image_bytes, COVER_RENDITIONS[rendition]))
+
+def get_cover_urls(book_ids, cover_hashes, rendition="medium"):
+    book_hashes = {}
+    missing_covers = []
+    missing_renditions = set()
+    for book_id, cover_hash in zip(book_ids, cover_hashes):
+        if not isinstance(cover_hash, str):
+            continue
+        book_hashes[int(book_id)] = cover_hash
+        if not os.path.exists(os.path.join(COVER_STORE_DIR, cover_rendition_name(cover_hash, rendition))):
+            missing_renditions.add(cover_hash)
+            if not os.path.exists(cover_path(cover_hash)):
+                missing_covers.append(book_id)
+
+    # Rewrite any files that were removed from the store from the BLOBs
+    for cover in get_book_covers(missing_covers).values():
+        store_cover(cover)
+
+    # Render missing renditions in parallel on the cover pool; covers that
+    # cannot be rendered get no URL rather than a broken image
+    pool = get_cover_pool()
+    futures = {cover_hash: pool.submit(store_cover_rendition, cover_hash, rendition) for cover_hash in missing_renditions}
+    failed = set()
+    for cover_hash, future in futures.items():
+        try:
+            future.result()
+        except Exception:
+            failed.add(cover_hash)
+
+    return {book_id: f"{COVER_URL_PREFIX}/{cover_rendition_name(cover_hash, rendition)}"
+            for book_id, cover_hash in book_hashes.items() if cover_hash not in failed}
+
+def get_cover_url(book_id, cover_hash, rendition="medium"):
+    return get_cover_urls([book_id], [cover_hash], rendition).get(int(book_id))
+
+def get_book_covers(book_ids):
+    # Fetch covers for a small batch of books (e.g. one grid row) in one query
+    book_ids = [int(book_id) for book_id in book_ids]
+    if not book_ids:
+        return {}
+    placeholders = ", ".join("?" * len(book_ids))
+    with db_connection() as conn:
+        rows = conn.execute(
+            f"SELECT id, cover_image FROM books WHERE id IN ({placeholders}) AND cover_image IS NOT NULL",
+            book_ids
+        ).fetchall()
+    return dict(rows)
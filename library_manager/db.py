@@ -0,0 +1,113 @@
+import streamlit as st
+import sqlite3
+import threading
+from contextlib import contextmanager
+from streamlit import runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+
+from .dedup import book_isbn_key, book_title_author_key
+
+DB_PATH = 'library.db'
+
+# PRAGMAs applied once to every pooled connection
+DB_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 256 * 1024 * 1024,
+    "cache_size": -16000,  # negative means KiB, so roughly 16 MB of page cache
+}
+
+# Connection pool: keeps one long-lived connection per Streamlit session so the
+# page cache stays warm across reruns instead of reconnecting in every function
+class ConnectionPool:
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._connections = {}
+        self._depths = {}
+        # Bumped whenever a committed block changed rows; cached reads are keyed on it
+        self.generation = 0
+
+    def _session_key(self):
+        # Streamlit reruns a session's script on a fresh thread, so key on the
+        # session id rather than the thread; fall back to the thread outside Streamlit
+        ctx = get_script_run_ctx()
+        if ctx is not None:
+            return ctx.session_id
+        return f"thread-{threading.get_ident()}"
+
+    def _open(self):
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30)
+        for name, value in DB_PRAGMAS.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        conn.create_function("book_isbn_key", 1, book_isbn_key, deterministic=True)
+        conn.create_function("book_title_author_key", 2, book_title_author_key, deterministic=True)
+        return conn
+
+    def _prune_closed_sessions(self):
+        # Drop connections whose Streamlit session has gone away. A session whose
+        # tab disconnected can still be running its script, so connections that
+        # are in use are left until their next call finds them idle.
+        if not runtime.exists():
+            return
+        rt = runtime.get_instance()
+        for key in list(self._connections):
+            if key.startswith("thread-") or self._depths.get(key, 0) > 0:
+                continue
+            if not rt.is_active_session(key):
+                self._connections.pop(key).close()
+                self._depths.pop(key, None)
+
+    def _acquire(self):
+        # The session's connection and its new nesting depth, counted under the
+        # lock so pruning never sees a connection as idle while it is handed out
+        key = self._session_key()
+        with self._lock:
+            conn = self._connections.get(key)
+            if conn is None:
+                self._prune_closed_sessions()
+                conn = self._open()
+                self._connections[key] = conn
+            depth = self._depths.get(key, 0) + 1
+            self._depths[key] = depth
+        return key, conn, depth
+
+    def _release(self, key):
+        with self._lock:
+            if self._depths.get(key, 0) > 0:
+                self._depths[key] -= 1
+
+    @contextmanager
+    def connection(self):
+        key, conn, depth = self._acquire()
+        outermost = depth == 1
+        if outermost:
+            changes_before = conn.total_changes
+        try:
+            yield conn
+        except BaseException:
+            if outermost:
+                conn.rollback()
+            raise
+        else:
+            # Only the outermost block commits, so nested helpers share one transaction
+            if outermost:
+                conn.commit()
+                if conn.total_changes != changes_before:
+                    self.bump_generation()
+        finally:
+            self._release(key)
+
+    def bump_generation(self):
+        with self._lock:
+            self.generation += 1
+
+@st.cache_resource
+def get_connection_pool():
+    return ConnectionPool(DB_PATH)
+
+def db_connection():
+    return get_connection_pool().connection()
+
+def get_db_generation():
+    return get_connection_pool().generation
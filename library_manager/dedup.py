@@ -0,0 +1,82 @@
+import re
+import hashlib
+import unicodedata
+
+# Duplicate detection keys. Both are registered as SQL functions on every
+# pooled connection so queries and migrations can derive them too.
+def book_isbn_key(isbn):
+    # ISBN digits only, with ISBN-10s converted to ISBN-13 so both forms match;
+    # None for anything that is not a 10 or 13 character ISBN
+    digits = re.sub(r"[^0-9X]", "", str(isbn or "").upper())
+    if len(digits) == 10 and digits[:9].isdigit():
+        digits = "978" + digits[:9]
+        checksum = sum(int(d) * (3 if i % 2 else 1) for i, d in enumerate(digits))
+        return digits + str(-checksum % 10)
+    if len(digits) == 13 and digits.isdigit():
+        return digits
+    return None
+
+def book_title_author_key(title, author):
+    # Hash of the case-folded title and author with punctuation and extra spaces removed
+    words = []
+    for value in (title, author):
+        normalized = " ".join(re.findall(r"\w+", unicodedata.normalize("NFKC", str(value or "")).casefold()))
+        if not normalized:
+            return None
+        words.append(normalized)
+    return hashlib.blake2b("\x1f".join(words).encode("utf-8"), digest_size=8).hexdigest()
+
+# Duplicate detection. Every book stores its keys in the indexed isbn_key and
+# title_author_key columns, and book_dedup_keys records which book holds each
+# key: the oldest copy at the time it was claimed. Later copies of the same book
+# are found by probing book_dedup_keys and take over a key when its holder lets go.
+DEDUP_KEY_COLUMNS = ("isbn_key", "title_author_key")
+
+def claim_dedup_keys(conn, min_id):
+    # Record books from min_id on as holders of any keys no other book holds,
+    # in id order; INSERT OR IGNORE leaves a key with its current holder
+    for column in DEDUP_KEY_COLUMNS:
+        conn.execute(f'''
+        INSERT OR IGNORE INTO book_dedup_keys (kind, key, book_id)
+        SELECT '{column}', {column}, id FROM books WHERE id >= ? AND {column} IS NOT NULL ORDER BY id
+        ''', (min_id,))
+
+def release_dedup_key(conn, book_id, column, key):
+    # Pass a key the book no longer has on to the oldest remaining book with it
+    released = conn.execute("DELETE FROM book_dedup_keys WHERE kind = ? AND key = ? AND book_id = ?",
+                            (column, key, book_id)).rowcount
+    if released:
+        conn.execute(f'''
+        INSERT OR IGNORE INTO book_dedup_keys (kind, key, book_id)
+        SELECT ?, {column}, id FROM books WHERE {column} = ? ORDER BY id LIMIT 1
+        ''', (column, key))
+
+def refresh_dedup_keys(conn, book_id):
+    # Re-derive a book's keys after it is added or edited. Only keys that changed
+    # are touched: the old one is released and the new one claimed unless
+    # another book already holds it
+    row = conn.execute('''
+    SELECT isbn_key, title_author_key, book_isbn_key(isbn), book_title_author_key(title, author)
+    FROM books WHERE id = ?
+    ''', (book_id,)).fetchone()
+    if row is None:
+        return
+    for column, old_key, new_key in zip(DEDUP_KEY_COLUMNS, row[:2], row[2:]):
+        if old_key == new_key:
+            continue
+        conn.execute(f"UPDATE books SET {column} = ? WHERE id = ?", (new_key, book_id))
+        if old_key is not None:
+            release_dedup_key(conn, book_id, column, old_key)
+        if new_key is not None:
+            conn.execute("INSERT OR IGNORE INTO book_dedup_keys (kind, key, book_id) VALUES (?, ?, ?)",
+                         (column, new_key, book_id))
+
+def find_duplicate_book(conn, isbn_key, title_author_key):
+    # Id of the book holding either key, or None
+    row = conn.execute('''
+    SELECT book_id FROM book_dedup_keys WHERE kind = 'isbn_key' AND key = ?
+    UNION ALL
+    SELECT book_id FROM book_dedup_keys WHERE kind = 'title_author_key' AND key = ?
+    LIMIT 1
+    ''', (isbn_key, title_author_key)).fetchone()
+    return row[0] if row else None
@@ -0,0 +1,50 @@
+import numpy as np
+import re
+import zlib
+import unicodedata
+
+# Similar books. Each book's title, author, genre, publisher and notes are
+# hashed into FEATURE_BUCKETS term counts, stored per book in book_features and
+# refreshed whenever the book is written. similarity.py scores the cosine of
+# TF-IDF weighted count vectors against every book at once with NumPy.
+FEATURE_BUCKETS = 1 << 18
+# Fields split into words, and fields matched as a whole value
+FEATURE_WORD_FIELDS = ["title", "notes"]
+FEATURE_VALUE_FIELDS = ["author", "genre", "publisher"]
+
+def book_feature_counts(book):
+    # Sorted feature buckets and term counts for a book's text fields
+    tokens = []
+    for field in FEATURE_WORD_FIELDS:
+        text = unicodedata.normalize("NFKC", str(book[field] or "")).casefold()
+        tokens.extend(f"{field}:{word}" for word in re.findall(r"\w{2,}", text))
+    for field in FEATURE_VALUE_FIELDS:
+        value = " ".join(re.findall(r"\w+", unicodedata.normalize("NFKC", str(book[field] or "")).casefold()))
+        if value:
+            tokens.append(f"{field}={value}")
+    buckets = np.array([zlib.crc32(token.encode("utf-8")) % FEATURE_BUCKETS for token in tokens], dtype=np.int32)
+    return np.unique(buckets, return_counts=True)
+
+def refresh_book_features(conn, book_ids=None):
+    # Recompute the stored features for some books, or (None) all of them. Rows
+    # whose features are unchanged are left alone, so book_features_version only
+    # moves when the similarity index actually needs rebuilding
+    where, params = "", []
+    if book_ids is not None:
+        params = [int(book_id) for book_id in book_ids]
+        if not params:
+            return
+        where = f"WHERE id IN ({', '.join('?' * len(params))})"
+    rows = conn.execute(f"SELECT id, {', '.join(FEATURE_WORD_FIELDS + FEATURE_VALUE_FIELDS)} FROM books {where}",
+                        params).fetchall()
+    fields = ["id"] + FEATURE_WORD_FIELDS + FEATURE_VALUE_FIELDS
+
+    features = []
+    for row in rows:
+        buckets, counts = book_feature_counts(dict(zip(fields, row)))
+        features.append((row[0], buckets.astype(np.int32).tobytes(), counts.astype(np.int32).tobytes()))
+    conn.executemany('''
+    INSERT INTO book_features (book_id, buckets, counts) VALUES (?, ?, ?)
+    ON CONFLICT (book_id) DO UPDATE SET buckets = excluded.buckets, counts = excluded.counts
+    WHERE buckets IS NOT excluded.buckets OR counts IS NOT excluded.counts
+    ''', features)
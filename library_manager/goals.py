@@ -0,0 +1,148 @@
+import streamlit as st
+import pandas as pd
+from datetime import datetime
+import numpy as np
+from dataclasses import dataclass
+
+from .db import db_connection
+
+# Reading goals operations
+def set_reading_goal(year, target_books, target_pages):
+    with db_connection() as conn:
+        c = conn.cursor()
+
+        # Check if goal for year exists
+        c.execute("SELECT id FROM reading_goals WHERE year = ?", (year,))
+        existing = c.fetchone()
+
+        if existing:
+            c.execute('''
+            UPDATE reading_goals
+            SET target_books = ?, target_pages = ?
+            WHERE year = ?
+            ''', (target_books, target_pages, year))
+        else:
+            c.execute('''
+            INSERT INTO reading_goals (year, target_books, target_pages)
+            VALUES (?, ?, ?)
+            ''', (year, target_books, target_pages))
+
+def get_reading_goal(year):
+    with db_connection() as conn:
+        c = conn.cursor()
+        c.execute("SELECT * FROM reading_goals WHERE year = ?", (year,))
+        goal = c.fetchone()
+
+    if goal:
+        return {"year": goal[1], "target_books": goal[2], "target_pages": goal[3]}
+    return None
+
+def year_bounds(first_year, last_year=None):
+    # Half-open ISO date range [first_year-01-01, last_year+1-01-01), which the
+    # date_finished index can answer with a range scan
+    last_year = first_year if last_year is None else last_year
+    return f"{first_year:04d}-01-01", f"{last_year + 1:04d}-01-01"
+
+# Books and pages finished in a date range, in one pass over reading_history
+READING_PROGRESS_QUERY = '''
+SELECT COUNT(*) AS books_read, IFNULL(SUM(b.total_pages), 0) AS pages_read
+FROM reading_history rh
+LEFT JOIN books b ON rh.book_id = b.id
+WHERE rh.date_finished >= ? AND rh.date_finished < ?
+'''
+
+@dataclass
+class ReadingProgress:
+    books_read: int = 0
+    pages_read: int = 0
+
+def get_reading_goals():
+    with db_connection() as conn:
+        return pd.read_sql_query(
+            "SELECT year, target_books, target_pages FROM reading_goals ORDER BY year",
+            conn
+        )
+
+@dataclass
+class ReadingHistorySummary:
+    # Books and pages finished per calendar month, as parallel arrays sorted by (year, month)
+    years: np.ndarray
+    months: np.ndarray
+    books: np.ndarray
+    pages: np.ndarray
+
+    def yearly_totals(self, years):
+        # Books and pages finished in each of `years` (which must be sorted), zero where none
+        years = np.asarray(years, dtype=np.int64)
+        books = np.zeros(len(years), dtype=np.int64)
+        pages = np.zeros(len(years), dtype=np.int64)
+        if len(years) and len(self.years):
+            pos = np.searchsorted(years, self.years)
+            matched = (pos < len(years)) & (years[np.minimum(pos, len(years) - 1)] == self.years)
+            np.add.at(books, pos[matched], self.books[matched])
+            np.add.at(pages, pos[matched], self.pages[matched])
+        return books, pages
+
+    def monthly_books(self, year):
+        # Books finished in each month of `year`, January first
+        books = np.zeros(12, dtype=np.int64)
+        in_year = self.years == year
+        books[self.months[in_year] - 1] = self.books[in_year]
+        return books
+
+    def progress(self, year):
+        books, pages = self.yearly_totals([year])
+        return ReadingProgress(books_read=int(books[0]), pages_read=int(pages[0]))
+
+def get_reading_history_summary():
+    # The whole reading history grouped by month in one covering-index scan
+    with db_connection() as conn:
+        rows = conn.execute('''
+        SELECT CAST(substr(rh.date_finished, 1, 4) AS INTEGER) AS year,
+               CAST(substr(rh.date_finished, 6, 2) AS INTEGER) AS month,
+               COUNT(*) AS books_read, IFNULL(SUM(b.total_pages), 0) AS pages_read
+        FROM reading_history rh
+        LEFT JOIN books b ON rh.book_id = b.id
+        WHERE rh.date_finished IS NOT NULL
+        GROUP BY year, month
+        HAVING month BETWEEN 1 AND 12
+        ORDER BY year, month
+        ''').fetchall()
+
+    columns = np.array(rows, dtype=np.int64).reshape(-1, 4)
+    return ReadingHistorySummary(
+        years=columns[:, 0], months=columns[:, 1], books=columns[:, 2], pages=columns[:, 3]
+    )
+
+def compute_reading_pace(years, target_books, target_pages, books_read, pages_read, today=None):
+    # Books per week and pages per day still needed to reach each year's goal,
+    # computed for every year at once. Years that are already over get NaN.
+    today = np.datetime64(today or datetime.now().date(), "D")
+    years = np.asarray(years, dtype=np.int64)
+    year_start = (years - 1970).astype("datetime64[Y]").astype("datetime64[D]")
+    year_end = (years - 1969).astype("datetime64[Y]").astype("datetime64[D]")
+    days_in_year = (year_end - year_start).astype(np.int64)
+    days_passed = np.clip((today - year_start).astype(np.int64) + 1, 0, days_in_year)
+    days_remaining = np.maximum(days_in_year - days_passed, 1)
+
+    days_remaining = np.where(today >= year_end, np.nan, days_remaining)
+
+    books_remaining = np.maximum(np.asarray(target_books) - np.asarray(books_read), 0)
+    pages_remaining = np.maximum(np.asarray(target_pages) - np.asarray(pages_read), 0)
+    return {
+        "books_per_week": books_remaining / days_remaining * 7,
+        "pages_per_day": pages_remaining / days_remaining,
+    }
+
+# Memoized on the database generation, like the dashboard aggregates in stats.py
+@st.cache_data(max_entries=32, show_spinner=False)
+def get_cached_reading_goal(generation, year):
+    return get_reading_goal(year)
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def get_cached_reading_history_summary(generation):
+    return get_reading_history_summary()
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def get_cached_reading_goals(generation):
+    return get_reading_goals()
@@ -0,0 +1,37 @@
+import pandas as pd
+from datetime import datetime
+
+from .db import db_connection
+
+# Loan operations
+def add_loan(book_id, borrower_name, expected_return_date):
+    with db_connection() as conn:
+        c = conn.cursor()
+        date_loaned = datetime.now().strftime("%Y-%m-%d")
+
+        c.execute('''
+        INSERT INTO loans (book_id, borrower_name, date_loaned, expected_return_date, returned)
+        VALUES (?, ?, ?, ?, ?)
+        ''', (book_id, borrower_name, date_loaned, expected_return_date, False))
+
+def get_loans(include_returned=False):
+    if include_returned:
+        query = '''
+        SELECT l.*, b.title, b.author
+        FROM loans l
+        JOIN books b ON l.book_id = b.id
+        '''
+    else:
+        query = '''
+        SELECT l.*, b.title, b.author
+        FROM loans l
+        JOIN books b ON l.book_id = b.id
+        WHERE l.returned = 0
+        '''
+
+    with db_connection() as conn:
+        return pd.read_sql_query(query, conn)
+
+def mark_as_returned(loan_id):
+    with db_connection() as conn:
+        conn.execute("UPDATE loans SET returned = 1 WHERE id = ?", (loan_id,))
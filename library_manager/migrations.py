@@ -0,0 +1,505 @@
+import json
+
+from .db import db_connection
+from .dedup import DEDUP_KEY_COLUMNS
+from .covers import store_cover
+from .features import refresh_book_features
+
+# Schema migrations. Each one upgrades the schema by a single version and
+# PRAGMA user_version records the last migration applied, so init_db only does
+# work when the database is behind.
+def migrate_create_tables(conn):
+    c = conn.cursor()
+
+    # Books table
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS books (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        author TEXT NOT NULL,
+        genre TEXT,
+        status TEXT,
+        rating INTEGER,
+        date_added TEXT,
+        notes TEXT,
+        cover_image BLOB,
+        total_pages INTEGER,
+        pages_read INTEGER,
+        isbn TEXT,
+        publication_year INTEGER,
+        publisher TEXT,
+        collections TEXT  -- legacy JSON list, superseded by book_collections
+    )
+    ''')
+
+    # Databases created by early versions lack the later book columns
+    book_columns = [row[1] for row in c.execute("PRAGMA table_info(books)")]
+    for column, column_type in [("cover_image", "BLOB"), ("total_pages", "INTEGER"), ("pages_read", "INTEGER DEFAULT 0"),
+                                ("isbn", "TEXT"), ("publication_year", "INTEGER"), ("publisher", "TEXT"),
+                                ("collections", "TEXT")]:
+        if column not in book_columns:
+            c.execute(f"ALTER TABLE books ADD COLUMN {column} {column_type}")
+
+    # Wishlist table
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS wishlist (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        title TEXT NOT NULL,
+        author TEXT NOT NULL,
+        priority TEXT,
+        notes TEXT,
+        date_added TEXT
+    )
+    ''')
+
+    # Loans table
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS loans (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        book_id INTEGER,
+        borrower_name TEXT NOT NULL,
+        date_loaned TEXT,
+        expected_return_date TEXT,
+        returned BOOLEAN,
+        FOREIGN KEY (book_id) REFERENCES books (id)
+    )
+    ''')
+
+    # Reading goals table
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS reading_goals (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        year INTEGER,
+        target_books INTEGER,
+        target_pages INTEGER
+    )
+    ''')
+
+    # Collections table
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS collections (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,
+        description TEXT,
+        date_created TEXT
+    )
+    ''')
+
+    # Reading history table
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS reading_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        book_id INTEGER,
+        date_started TEXT,
+        date_finished TEXT,
+        FOREIGN KEY (book_id) REFERENCES books (id)
+    )
+    ''')
+
+def migrate_cover_hash(conn):
+    c = conn.cursor()
+
+    # Cover store hash column, backfilled for covers saved before it existed
+    book_columns = [row[1] for row in c.execute("PRAGMA table_info(books)")]
+    if "cover_hash" not in book_columns:
+        c.execute("ALTER TABLE books ADD COLUMN cover_hash TEXT")
+    pending = conn.execute("SELECT id, cover_image FROM books WHERE cover_image IS NOT NULL AND cover_hash IS NULL")
+    for book_id, cover in pending:
+        c.execute("UPDATE books SET cover_hash = ? WHERE id = ?", (store_cover(cover), book_id))
+
+def migrate_book_collections(conn):
+    c = conn.cursor()
+
+    # Book/collection membership table
+    c.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'book_collections'")
+    has_book_collections = c.fetchone() is not None
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS book_collections (
+        book_id INTEGER NOT NULL,
+        collection_id INTEGER NOT NULL,
+        PRIMARY KEY (book_id, collection_id),
+        FOREIGN KEY (book_id) REFERENCES books (id),
+        FOREIGN KEY (collection_id) REFERENCES collections (id)
+    ) WITHOUT ROWID
+    ''')
+    c.execute('''
+    CREATE INDEX IF NOT EXISTS idx_book_collections_collection
+    ON book_collections (collection_id, book_id)
+    ''')
+
+    # Move memberships out of the legacy JSON column the first time round
+    if not has_book_collections:
+        collection_ids = {}
+        for collection_id, name in c.execute("SELECT id, name FROM collections"):
+            collection_ids.setdefault(name, []).append(collection_id)
+        memberships = []
+        for book_id, collections_json in c.execute("SELECT id, collections FROM books WHERE collections IS NOT NULL"):
+            try:
+                names = json.loads(collections_json)
+            except (TypeError, ValueError):
+                continue
+            if not isinstance(names, list):
+                continue
+            for name in names:
+                memberships.extend((book_id, collection_id) for collection_id in collection_ids.get(name, []))
+        c.executemany("INSERT OR IGNORE INTO book_collections (book_id, collection_id) VALUES (?, ?)", memberships)
+
+def migrate_lookup_indexes(conn):
+    # Indexes for the columns the stats, goals, loans and recommendation queries filter or group on
+    for table, column in [("reading_history", "book_id"), ("reading_history", "date_finished"),
+                          ("loans", "book_id"), ("loans", "returned"),
+                          ("books", "status"), ("books", "genre"), ("books", "rating"),
+                          ("reading_goals", "year")]:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_{table}_{column} ON {table} ({column})")
+
+def migrate_books_fts(conn):
+    c = conn.cursor()
+
+    # Full-text index over the searchable book fields. It reads its text from
+    # the books table (external content) and triggers keep it in sync.
+    c.execute('''
+    CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5(
+        title, author, genre, publisher, isbn, notes,
+        content='books', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    ''')
+    c.execute('''
+    CREATE TRIGGER IF NOT EXISTS books_fts_insert AFTER INSERT ON books BEGIN
+        INSERT INTO books_fts (rowid, title, author, genre, publisher, isbn, notes)
+        VALUES (new.id, new.title, new.author, new.genre, new.publisher, new.isbn, new.notes);
+    END
+    ''')
+    c.execute('''
+    CREATE TRIGGER IF NOT EXISTS books_fts_delete AFTER DELETE ON books BEGIN
+        INSERT INTO books_fts (books_fts, rowid, title, author, genre, publisher, isbn, notes)
+        VALUES ('delete', old.id, old.title, old.author, old.genre, old.publisher, old.isbn, old.notes);
+    END
+    ''')
+    c.execute('''
+    CREATE TRIGGER IF NOT EXISTS books_fts_update
+    AFTER UPDATE OF title, author, genre, publisher, isbn, notes ON books BEGIN
+        INSERT INTO books_fts (books_fts, rowid, title, author, genre, publisher, isbn, notes)
+        VALUES ('delete', old.id, old.title, old.author, old.genre, old.publisher, old.isbn, old.notes);
+        INSERT INTO books_fts (rowid, title, author, genre, publisher, isbn, notes)
+        VALUES (new.id, new.title, new.author, new.genre, new.publisher, new.isbn, new.notes);
+    END
+    ''')
+
+    # Index the books that already exist
+    c.execute("INSERT INTO books_fts (books_fts) VALUES ('rebuild')")
+
+def migrate_library_sort_indexes(conn):
+    # Indexes for the My Library sort orders, so a page can be read in order
+    # instead of sorting every matching book first
+    for column in ["title", "author", "date_added", "publication_year"]:
+        conn.execute(f"CREATE INDEX IF NOT EXISTS idx_books_{column} ON books ({column})")
+
+def migrate_stats_tables(conn):
+    c = conn.cursor()
+
+    # Dashboard counters, kept current by the triggers below so reading them
+    # costs the same however large the library grows. NULL status/genre values
+    # are stored as '' because NULL never conflicts in an upsert.
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS stats_status_counts (
+        status TEXT PRIMARY KEY,
+        count INTEGER NOT NULL DEFAULT 0
+    )
+    ''')
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS stats_genre_counts (
+        genre TEXT PRIMARY KEY,
+        count INTEGER NOT NULL DEFAULT 0
+    )
+    ''')
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS stats_rating (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        rating_sum INTEGER NOT NULL DEFAULT 0,
+        rating_count INTEGER NOT NULL DEFAULT 0
+    )
+    ''')
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS stats_monthly_finished (
+        month TEXT PRIMARY KEY,  -- YYYY-MM
+        count INTEGER NOT NULL DEFAULT 0
+    )
+    ''')
+
+    # Book counters
+    c.execute('''
+    CREATE TRIGGER IF NOT EXISTS stats_books_insert AFTER INSERT ON books BEGIN
+        INSERT INTO stats_status_counts (status, count) VALUES (IFNULL(new.status, ''), 1)
+        ON CONFLICT (status) DO UPDATE SET count = count + 1;
+        INSERT INTO stats_genre_counts (genre, count) VALUES (IFNULL(new.genre, ''), 1)
+        ON CONFLICT (genre) DO UPDATE SET count = count + 1;
+        UPDATE stats_rating SET rating_sum = rating_sum + new.rating, rating_count = rating_count + 1
+        WHERE new.rating > 0;
+    END
+    ''')
+    c.execute('''
+    CREATE TRIGGER IF NOT EXISTS stats_books_delete AFTER DELETE ON books BEGIN
+        UPDATE stats_status_counts SET count = count - 1 WHERE status = IFNULL(old.status, '');
+        UPDATE stats_genre_counts SET count = count - 1 WHERE genre = IFNULL(old.genre, '');
+        UPDATE stats_rating SET rating_sum = rating_sum - old.rating, rating_count = rating_count - 1
+        WHERE old.rating > 0;
+    END
+    ''')
+    c.execute('''
+    CREATE TRIGGER IF NOT EXISTS stats_books_update_status AFTER UPDATE OF status ON books
+    WHEN old.status IS NOT new.status BEGIN
+        UPDATE stats_status_counts SET count = count - 1 WHERE status = IFNULL(old.status, '');
+        INSERT INTO stats_status_counts (status, count) VALUES (IFNULL(new.status, ''), 1)
+        ON CONFLICT (status) DO UPDATE SET count = count + 1;
+    END
+    ''')
+    c.execute('''
+    CREATE TRIGGER IF NOT EXISTS stats_books_update_genre AFTER UPDATE OF genre ON books
+    WHEN old.genre IS NOT new.genre BEGIN
+        UPDATE stats_genre_counts SET count = count - 1 WHERE genre = IFNULL(old.genre, '');
+        INSERT INTO stats_genre_counts (genre, count) VALUES (IFNULL(new.genre, ''), 1)
+        ON CONFLICT (genre) DO UPDATE SET count = count + 1;
+    END
+    ''')
+    c.execute('''
+    CREATE TRIGGER IF NOT EXISTS stats_books_update_rating AFTER UPDATE OF rating ON books
+    WHEN old.rating IS NOT new.rating BEGIN
+        UPDATE stats_rating SET rating_sum = rating_sum - old.rating, rating_count = rating_count - 1
+        WHERE old.rating > 0;
+        UPDATE stats_rating SET rating_sum = rating_sum + new.rating, rating_count = rating_count + 1
+        WHERE new.rating > 0;
+    END
+    ''')
+
+    # Books finished per month
+    c.execute('''
+    CREATE TRIGGER IF NOT EXISTS stats_history_insert AFTER INSERT ON reading_history
+    WHEN new.date_finished IS NOT NULL BEGIN
+        INSERT INTO stats_monthly_finished (month, count) VALUES (substr(new.date_finished, 1, 7), 1)
+        ON CONFLICT (month) DO UPDATE SET count = count + 1;
+    END
+    ''')
+    c.execute('''
+    CREATE TRIGGER IF NOT EXISTS stats_history_delete AFTER DELETE ON reading_history
+    WHEN old.date_finished IS NOT NULL BEGIN
+        UPDATE stats_monthly_finished SET count = count - 1 WHERE month = substr(old.date_finished, 1, 7);
+    END
+    ''')
+    c.execute('''
+    CREATE TRIGGER IF NOT EXISTS stats_history_update AFTER UPDATE OF date_finished ON reading_history
+    WHEN old.date_finished IS NOT new.date_finished BEGIN
+        UPDATE stats_monthly_finished SET count = count - 1 WHERE month = substr(old.date_finished, 1, 7);
+        INSERT INTO stats_monthly_finished (month, count)
+        SELECT substr(new.date_finished, 1, 7), 1 WHERE new.date_finished IS NOT NULL
+        ON CONFLICT (month) DO UPDATE SET count = count + 1;
+    END
+    ''')
+
+    # Seed the counters from the existing rows
+    c.execute("DELETE FROM stats_status_counts")
+    c.execute("INSERT INTO stats_status_counts (status, count) SELECT IFNULL(status, ''), COUNT(*) FROM books GROUP BY 1")
+    c.execute("DELETE FROM stats_genre_counts")
+    c.execute("INSERT INTO stats_genre_counts (genre, count) SELECT IFNULL(genre, ''), COUNT(*) FROM books GROUP BY 1")
+    c.execute('''
+    INSERT OR REPLACE INTO stats_rating (id, rating_sum, rating_count)
+    SELECT 1, IFNULL(SUM(rating), 0), COUNT(*) FROM books WHERE rating > 0
+    ''')
+    c.execute("DELETE FROM stats_monthly_finished")
+    c.execute('''
+    INSERT INTO stats_monthly_finished (month, count)
+    SELECT substr(date_finished, 1, 7), COUNT(*) FROM reading_history
+    WHERE date_finished IS NOT NULL GROUP BY 1
+    ''')
+
+def migrate_reading_history_dates(conn):
+    c = conn.cursor()
+
+    # Store reading dates as plain ISO YYYY-MM-DD so year and month filters can
+    # be index range scans; values SQLite cannot parse as dates are left alone
+    for column in ["date_started", "date_finished"]:
+        c.execute(f'''
+        UPDATE reading_history SET {column} = date({column})
+        WHERE date({column}) IS NOT NULL AND date({column}) != {column}
+        ''')
+
+    # Covering index for the progress queries, which only need the finish date
+    # and the book id; it replaces the single-column date_finished index
+    c.execute("DROP INDEX IF EXISTS idx_reading_history_date_finished")
+    c.execute('''
+    CREATE INDEX IF NOT EXISTS idx_reading_history_finished_book
+    ON reading_history (date_finished, book_id)
+    ''')
+
+def migrate_book_dedup_keys(conn):
+    c = conn.cursor()
+
+    # Duplicate detection key columns; migrate_dedup_key_holders fills them in
+    # and indexes them
+    book_columns = [row[1] for row in c.execute("PRAGMA table_info(books)")]
+    for column in DEDUP_KEY_COLUMNS:
+        if column not in book_columns:
+            c.execute(f"ALTER TABLE books ADD COLUMN {column} TEXT")
+
+def migrate_reading_affinity(conn):
+    c = conn.cursor()
+
+    # Rating totals per genre and per author, the affinity index recommendations
+    # are scored from. Kept current by triggers like the dashboard counters;
+    # unrated books (rating 0 or NULL) do not count.
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS reading_affinity (
+        kind TEXT NOT NULL,  -- 'genre' or 'author'
+        value TEXT NOT NULL,
+        rated_count INTEGER NOT NULL DEFAULT 0,
+        rating_sum INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (kind, value)
+    ) WITHOUT ROWID
+    ''')
+
+    add_new = '''
+        INSERT INTO reading_affinity (kind, value, rated_count, rating_sum)
+        SELECT 'genre', IFNULL(new.genre, ''), 1, new.rating WHERE new.rating > 0
+        ON CONFLICT (kind, value) DO UPDATE SET rated_count = rated_count + 1, rating_sum = rating_sum + excluded.rating_sum;
+        INSERT INTO reading_affinity (kind, value, rated_count, rating_sum)
+        SELECT 'author', IFNULL(new.author, ''), 1, new.rating WHERE new.rating > 0
+        ON CONFLICT (kind, value) DO UPDATE SET rated_count = rated_count + 1, rating_sum = rating_sum + excluded.rating_sum;
+    '''
+    remove_old = '''
+        UPDATE reading_affinity SET rated_count = rated_count - 1, rating_sum = rating_sum - old.rating
+        WHERE old.rating > 0 AND ((kind = 'genre' AND value = IFNULL(old.genre, ''))
+                                  OR (kind = 'author' AND value = IFNULL(old.author, '')));
+    '''
+    c.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS affinity_books_insert AFTER INSERT ON books BEGIN
+        {add_new}
+    END
+    ''')
+    c.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS affinity_books_delete AFTER DELETE ON books BEGIN
+        {remove_old}
+    END
+    ''')
+    c.execute(f'''
+    CREATE TRIGGER IF NOT EXISTS affinity_books_update AFTER UPDATE OF rating, genre, author ON books
+    WHEN old.rating IS NOT new.rating OR old.genre IS NOT new.genre OR old.author IS NOT new.author BEGIN
+        {remove_old}
+        {add_new}
+    END
+    ''')
+
+    # Seed the index from the existing ratings
+    c.execute("DELETE FROM reading_affinity")
+    c.execute('''
+    INSERT INTO reading_affinity (kind, value, rated_count, rating_sum)
+    SELECT 'genre', IFNULL(genre, ''), COUNT(*), SUM(rating) FROM books WHERE rating > 0 GROUP BY 2
+    UNION ALL
+    SELECT 'author', IFNULL(author, ''), COUNT(*), SUM(rating) FROM books WHERE rating > 0 GROUP BY 2
+    ''')
+
+def migrate_book_features(conn):
+    c = conn.cursor()
+
+    # Hashed term counts per book for "More like this" (see refresh_book_features)
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS book_features (
+        book_id INTEGER PRIMARY KEY,
+        buckets BLOB NOT NULL,  -- int32 feature buckets, ascending
+        counts BLOB NOT NULL,   -- int32 term count for each bucket
+        FOREIGN KEY (book_id) REFERENCES books (id)
+    )
+    ''')
+    c.execute('''
+    CREATE TRIGGER IF NOT EXISTS features_books_delete AFTER DELETE ON books BEGIN
+        DELETE FROM book_features WHERE book_id = old.id;
+    END
+    ''')
+
+    refresh_book_features(conn)
+
+def migrate_dedup_key_holders(conn):
+    c = conn.cursor()
+
+    # Which book holds each duplicate detection key moves to its own table, so
+    # the key columns can be filled in for every copy and indexed without the
+    # unique constraint. Releasing a key is then an index probe, not a rescan.
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS book_dedup_keys (
+        kind TEXT NOT NULL,  -- 'isbn_key' or 'title_author_key'
+        key TEXT NOT NULL,
+        book_id INTEGER NOT NULL,
+        PRIMARY KEY (kind, key),
+        FOREIGN KEY (book_id) REFERENCES books (id)
+    ) WITHOUT ROWID
+    ''')
+    for column in DEDUP_KEY_COLUMNS:
+        c.execute(f"DROP INDEX IF EXISTS idx_books_{column}")
+        c.execute(f"CREATE INDEX idx_books_{column} ON books ({column})")
+    c.execute("UPDATE books SET isbn_key = book_isbn_key(isbn), title_author_key = book_title_author_key(title, author)")
+
+    # Existing duplicates are kept; the oldest copy holds the keys
+    c.execute("DELETE FROM book_dedup_keys")
+    for column in DEDUP_KEY_COLUMNS:
+        c.execute(f'''
+        INSERT INTO book_dedup_keys (kind, key, book_id)
+        SELECT '{column}', {column}, MIN(id) FROM books WHERE {column} IS NOT NULL GROUP BY {column}
+        ''')
+
+def migrate_book_features_version(conn):
+    c = conn.cursor()
+
+    # Counter bumped by triggers whenever a row of book_features is written or
+    # removed; the cached similarity index is keyed on it
+    c.execute('''
+    CREATE TABLE IF NOT EXISTS book_features_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL
+    )
+    ''')
+    c.execute("INSERT OR IGNORE INTO book_features_version (id, version) VALUES (1, 0)")
+    for event in ["INSERT", "UPDATE", "DELETE"]:
+        c.execute(f'''
+        CREATE TRIGGER IF NOT EXISTS features_version_{event.lower()} AFTER {event} ON book_features BEGIN
+            UPDATE book_features_version SET version = version + 1;
+        END
+        ''')
+
+SCHEMA_MIGRATIONS = [
+    migrate_create_tables,
+    migrate_cover_hash,
+    migrate_book_collections,
+    migrate_lookup_indexes,
+    migrate_books_fts,
+    migrate_library_sort_indexes,
+    migrate_stats_tables,
+    migrate_reading_history_dates,
+    migrate_book_dedup_keys,
+    migrate_reading_affinity,
+    migrate_book_features,
+    migrate_dedup_key_holders,
+    migrate_book_features_version,
+]
+SCHEMA_VERSION = len(SCHEMA_MIGRATIONS)
+
+def get_schema_version(conn):
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+# Initialize database
+def init_db():
+    with db_connection() as conn:
+        # Up to date: nothing to create or alter on this run
+        if get_schema_version(conn) >= SCHEMA_VERSION:
+            return
+
+        while True:
+            # Each migration gets its own write transaction; the version is
+            # re-read under the lock in case another session already upgraded
+            conn.execute("BEGIN IMMEDIATE")
+            version = get_schema_version(conn)
+            if version >= SCHEMA_VERSION:
+                conn.commit()
+                break
+            SCHEMA_MIGRATIONS[version](conn)
+            conn.execute(f"PRAGMA user_version = {version + 1}")
+            conn.commit()
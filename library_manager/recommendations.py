@@ -0,0 +1,57 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+
+from .db import db_connection
+from .books import BOOK_LIST_COLUMNS
+
+# Book recommendations. Each genre and author gets a weight from the ratings
+# in reading_affinity: the average rating's distance from a neutral 3, shrunk
+# towards zero while there are few ratings. Every "To Read" book is scored from
+# its genre and author weights at once and the best num_recommendations are
+# returned, ties going to the book added first.
+AFFINITY_NEUTRAL_RATING = 3
+AFFINITY_PRIOR_COUNT = 1
+AFFINITY_WEIGHTS = {"genre": 1.0, "author": 1.5}
+
+def get_affinity_weights():
+    weights = {kind: {} for kind in AFFINITY_WEIGHTS}
+    with db_connection() as conn:
+        rows = conn.execute("SELECT kind, value, rated_count, rating_sum FROM reading_affinity WHERE rated_count > 0")
+        for kind, value, rated_count, rating_sum in rows:
+            weights[kind][value] = ((rating_sum - AFFINITY_NEUTRAL_RATING * rated_count)
+                                    / (rated_count + AFFINITY_PRIOR_COUNT))
+    return weights
+
+def score_books(values, weights):
+    # Weight of each entry in `values`, looked up once per distinct value
+    distinct, inverse = np.unique(np.asarray(values, dtype=object), return_inverse=True)
+    return np.array([weights.get(value, 0.0) for value in distinct], dtype=float)[inverse]
+
+def get_book_recommendations(num_recommendations=3):
+    weights = get_affinity_weights()
+    with db_connection() as conn:
+        candidates = conn.execute(
+            "SELECT id, IFNULL(genre, ''), IFNULL(author, '') FROM books WHERE status = 'To Read'"
+        ).fetchall()
+    if not candidates:
+        return []
+
+    book_ids, genres, authors = zip(*candidates)
+    book_ids = np.array(book_ids, dtype=np.int64)
+    scores = (AFFINITY_WEIGHTS["genre"] * score_books(genres, weights["genre"])
+              + AFFINITY_WEIGHTS["author"] * score_books(authors, weights["author"]))
+    top_ids = book_ids[np.lexsort((book_ids, -scores))[:num_recommendations]]
+
+    placeholders = ", ".join("?" * len(top_ids))
+    with db_connection() as conn:
+        books = pd.read_sql_query(
+            f"SELECT {BOOK_LIST_COLUMNS} FROM books WHERE books.id IN ({placeholders})",
+            conn, params=[int(book_id) for book_id in top_ids]
+        ).set_index("id", drop=False)
+    return [books.loc[book_id] for book_id in top_ids if book_id in books.index]
+
+# Memoized on the database generation, like the dashboard aggregates in stats.py
+@st.cache_data(max_entries=8, show_spinner=False)
+def get_cached_book_recommendations(generation, num_recommendations=3):
+    return get_book_recommendations(num_recommendations)
@@ -0,0 +1,130 @@
+import streamlit as st
+import pandas as pd
+import json
+import re
+
+from .db import db_connection, get_db_generation
+from .books import BOOK_LIST_COLUMNS
+
+# Full-text search. The "Search by" choices map to books_fts columns (None
+# searches all of them), and BM25 weights favour title and author matches.
+SEARCH_FIELDS = {
+    "All Fields": None,
+    "Title": "title",
+    "Author": "author",
+    "Genre": "genre",
+    "Publisher": "publisher",
+    "ISBN": "isbn",
+    "Notes": "notes",
+}
+SEARCH_RANK = "bm25(books_fts, 10.0, 8.0, 2.0, 2.0, 5.0, 1.0)"
+
+def build_fts_query(search_term, column=None):
+    # Quoted text is matched as a phrase and every other word as a prefix.
+    # Tokens are re-quoted so user input can never be parsed as FTS5 syntax.
+    terms = []
+    for phrase, word in re.findall(r'"([^"]*)"|(\S+)', search_term):
+        tokens = re.findall(r"\w+", phrase or word)
+        if not tokens:
+            continue
+        terms.append('"' + " ".join(tokens) + '"' + ("" if phrase else "*"))
+
+    if not terms:
+        return None
+    query = " ".join(terms)
+    if column:
+        query = f"{column} : ({query})"
+    return query
+
+def search_books(search_term, search_by="All Fields", limit=None, after=None, within_ids=None):
+    # Matches are ordered by (rank, id). Passing the last row's (rank, id) as
+    # `after` fetches the next page without re-reading the earlier ones.
+    fts_query = build_fts_query(search_term, SEARCH_FIELDS.get(search_by))
+    if fts_query is None:
+        return pd.DataFrame()
+
+    conditions = ["books_fts MATCH ?"]
+    params = [fts_query]
+    if within_ids is not None:
+        conditions.append("books.id IN (SELECT value FROM json_each(?))")
+        params.append(json.dumps(within_ids))
+    if after is not None:
+        conditions.append(f"({SEARCH_RANK}, books.id) > (?, ?)")
+        params.extend(after)
+
+    query = f'''
+    SELECT {BOOK_LIST_COLUMNS},
+           snippet(books_fts, -1, '**', '**', '…', 12) AS snippet,
+           {SEARCH_RANK} AS rank
+    FROM books_fts
+    JOIN books ON books.id = books_fts.rowid
+    WHERE {" AND ".join(conditions)}
+    ORDER BY rank, books.id
+    '''
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit)
+
+    with db_connection() as conn:
+        return pd.read_sql_query(query, conn, params=params)
+
+def search_book_ids(search_term, search_by="All Fields", within_ids=None, limit=None):
+    # Ids of all matches, capped at limit + 1 so callers can tell the set was cut off
+    fts_query = build_fts_query(search_term, SEARCH_FIELDS.get(search_by))
+    if fts_query is None:
+        return []
+
+    query = "SELECT rowid FROM books_fts WHERE books_fts MATCH ?"
+    params = [fts_query]
+    if within_ids is not None:
+        query += " AND rowid IN (SELECT value FROM json_each(?))"
+        params.append(json.dumps(within_ids))
+    if limit is not None:
+        query += " LIMIT ?"
+        params.append(limit + 1)
+
+    with db_connection() as conn:
+        return [row[0] for row in conn.execute(query, params)]
+
+# Search page results are fetched a page at a time. The match ids of the last
+# term are kept in the session (when there are at most SEARCH_REFINE_LIMIT of
+# them), so typing more of the same term only re-checks those candidates.
+SEARCH_PAGE_SIZE = 20
+SEARCH_REFINE_LIMIT = 5000
+MIN_SEARCH_CHARS = 2
+
+def get_search_state(search_term, search_by):
+    generation = get_db_generation()
+    state = st.session_state.get('search_state')
+    # Anything cached before the library last changed is discarded
+    if state and state['generation'] != generation:
+        state = None
+    if state and state['term'] == search_term and state['search_by'] == search_by:
+        return state
+
+    within_ids = None
+    if (state and state['complete'] and state['search_by'] == search_by
+            and search_term.startswith(state['term'])):
+        within_ids = state['ids']
+
+    ids = search_book_ids(search_term, search_by, within_ids, limit=SEARCH_REFINE_LIMIT)
+    complete = len(ids) <= SEARCH_REFINE_LIMIT
+    state = {
+        "generation": generation,
+        "term": search_term,
+        "search_by": search_by,
+        "ids": ids if complete else None,
+        "complete": complete,
+        "results": search_books(search_term, search_by, limit=SEARCH_PAGE_SIZE,
+                                within_ids=ids if complete else None),
+    }
+    state["done"] = len(state["results"]) < SEARCH_PAGE_SIZE
+    st.session_state['search_state'] = state
+    return state
+
+def load_more_search_results(state):
+    last = state["results"].iloc[-1]
+    more = search_books(state["term"], state["search_by"], limit=SEARCH_PAGE_SIZE,
+                        after=(float(last["rank"]), int(last["id"])), within_ids=state["ids"])
+    state["results"] = pd.concat([state["results"], more], ignore_index=True)
+    state["done"] = len(more) < SEARCH_PAGE_SIZE
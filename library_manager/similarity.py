@@ -0,0 +1,80 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from dataclasses import dataclass
+
+from .db import db_connection
+from .books import BOOK_LIST_COLUMNS
+from .features import FEATURE_BUCKETS
+
+# "More like this" for the book details view, scored from the per-book term
+# counts kept in book_features (see features.py)
+SIMILAR_BOOKS_COUNT = 4
+
+@dataclass
+class SimilarityIndex:
+    # Row-normalized TF-IDF vectors for every book, as flat sparse entries
+    book_ids: np.ndarray  # book id of each row, ascending
+    offsets: np.ndarray   # row r's entries are offsets[r]:offsets[r + 1]
+    rows: np.ndarray
+    buckets: np.ndarray
+    weights: np.ndarray
+
+    def similar(self, book_id, k):
+        # Up to k (book id, similarity) pairs closest to book_id, best first
+        row = np.searchsorted(self.book_ids, book_id)
+        if row >= len(self.book_ids) or self.book_ids[row] != book_id:
+            return []
+        start, end = self.offsets[row], self.offsets[row + 1]
+        query = np.zeros(FEATURE_BUCKETS, dtype=np.float32)
+        query[self.buckets[start:end]] = self.weights[start:end]
+
+        scores = np.bincount(self.rows, weights=self.weights * query[self.buckets], minlength=len(self.book_ids))
+        scores[row] = 0
+        top = np.flatnonzero(scores > 0)
+        top = top[np.lexsort((self.book_ids[top], -scores[top]))][:k]
+        return [(int(self.book_ids[r]), float(scores[r])) for r in top]
+
+def build_similarity_index():
+    with db_connection() as conn:
+        rows = conn.execute("SELECT book_id, buckets, counts FROM book_features ORDER BY book_id").fetchall()
+
+    book_ids = np.array([row[0] for row in rows], dtype=np.int64)
+    buckets = [np.frombuffer(row[1], dtype=np.int32) for row in rows]
+    counts = [np.frombuffer(row[2], dtype=np.int32) for row in rows]
+    lengths = np.array([len(b) for b in buckets], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    entry_rows = np.repeat(np.arange(len(rows)), lengths)
+    buckets = np.concatenate(buckets) if rows else np.zeros(0, dtype=np.int32)
+    counts = np.concatenate(counts) if rows else np.zeros(0, dtype=np.int32)
+
+    # Each book lists a bucket once, so bucket frequencies are document frequencies
+    document_frequency = np.bincount(buckets, minlength=FEATURE_BUCKETS)
+    idf = np.log((1 + len(rows)) / (1 + document_frequency)) + 1
+    weights = ((1 + np.log(counts)) * idf[buckets]).astype(np.float32)
+    norms = np.sqrt(np.bincount(entry_rows, weights=weights.astype(np.float64) ** 2, minlength=len(rows)))
+    weights /= np.maximum(norms, 1e-12)[entry_rows].astype(np.float32)
+
+    return SimilarityIndex(book_ids=book_ids, offsets=offsets, rows=entry_rows, buckets=buckets, weights=weights)
+
+def get_book_features_version():
+    with db_connection() as conn:
+        return conn.execute("SELECT version FROM book_features_version").fetchone()[0]
+
+# Built once per version of book_features and shared between sessions, so
+# writes that leave every book's features as they were reuse the index
+@st.cache_resource(max_entries=2, show_spinner=False)
+def get_similarity_index(features_version):
+    return build_similarity_index()
+
+def get_similar_books(book_id, k=SIMILAR_BOOKS_COUNT):
+    similar = get_similarity_index(get_book_features_version()).similar(int(book_id), k)
+    if not similar:
+        return []
+    similar_ids = [similar_id for similar_id, _ in similar]
+    with db_connection() as conn:
+        books = pd.read_sql_query(
+            f"SELECT {BOOK_LIST_COLUMNS} FROM books WHERE books.id IN ({', '.join('?' * len(similar_ids))})",
+            conn, params=similar_ids
+        ).set_index("id", drop=False)
+    return [books.loc[similar_id] for similar_id in similar_ids if similar_id in books.index]
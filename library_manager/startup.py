@@ -0,0 +1,40 @@
+import time
+import streamlit as st
+import sys
+import importlib
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Startup timing. Each phase of a run is timed and the first (cold) time for
+# each is kept for the life of the server process; a phase over its budget is
+# logged as a warning. Open the app with ?timings=1 to see the report.
+STARTUP_BUDGET_SECONDS = {
+    "imports": 1.5,   # top-level imports, paid on the first run only
+    "init_db": 1.0,   # schema check and migrations, once per process
+    "import": 1.0,    # each lazily imported module
+    "render": 1.5,    # first render of each page
+}
+
+@st.cache_resource
+def get_startup_timings():
+    return {}
+
+def record_startup_timing(phase, seconds):
+    timings = get_startup_timings()
+    if phase in timings:
+        return
+    timings[phase] = seconds
+    budget = STARTUP_BUDGET_SECONDS.get(phase.split(" ")[0])
+    if budget is not None and seconds > budget:
+        logger.warning("%s took %.0f ms, over its %.0f ms budget", phase, seconds * 1000, budget * 1000)
+
+def lazy_import(name):
+    # Import a heavy module the first time something needs it, so pages that
+    # never use it (PIL, matplotlib, pyarrow) do not pay for loading it
+    module = sys.modules.get(name)
+    if module is None:
+        started = time.perf_counter()
+        module = importlib.import_module(name)
+        record_startup_timing(f"import {name}", time.perf_counter() - started)
+    return module
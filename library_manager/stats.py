@@ -0,0 +1,78 @@
+import streamlit as st
+from datetime import datetime
+from dataclasses import dataclass, field
+
+from .db import db_connection
+from .goals import year_bounds, READING_PROGRESS_QUERY, ReadingProgress
+
+# Statistics functions
+@dataclass
+class ReadingStats:
+    total_books: int = 0
+    status_counts: dict = field(default_factory=dict)  # status -> count
+    genre_counts: dict = field(default_factory=dict)  # top 5 genres -> count, largest first
+    avg_rating: float = 0.0
+    reading_velocity: float = 0.0  # books finished per active month this year
+    progress: ReadingProgress = field(default_factory=ReadingProgress)  # this year
+
+# Every dashboard metric in one round trip: the counters come from the
+# trigger-maintained stats_* tables and each row is tagged with its metric
+READING_STATS_QUERY = f'''
+WITH progress AS ({READING_PROGRESS_QUERY})
+SELECT 'status', NULLIF(status, ''), count FROM stats_status_counts WHERE count > 0
+UNION ALL
+SELECT 'genre', genre, count FROM (
+    SELECT NULLIF(genre, '') AS genre, count FROM stats_genre_counts
+    WHERE count > 0 ORDER BY count DESC LIMIT 5
+)
+UNION ALL
+SELECT 'avg_rating', NULL, CAST(rating_sum AS REAL) / NULLIF(rating_count, 0) FROM stats_rating
+UNION ALL
+SELECT 'month', month, count FROM stats_monthly_finished WHERE month BETWEEN ? AND ? AND count > 0
+UNION ALL
+SELECT 'books_read', NULL, books_read FROM progress
+UNION ALL
+SELECT 'pages_read', NULL, pages_read FROM progress
+'''
+
+def get_reading_stats():
+    current_year = datetime.now().year
+
+    with db_connection() as conn:
+        rows = conn.execute(
+            READING_STATS_QUERY,
+            (*year_bounds(current_year), f"{current_year}-01", f"{current_year}-12")
+        ).fetchall()
+
+    stats = ReadingStats()
+    status_counts, genre_counts, monthly_reads = [], [], []
+    for metric, label, value in rows:
+        if metric == "status":
+            status_counts.append((label, value))
+        elif metric == "genre":
+            genre_counts.append((label, value))
+        elif metric == "month":
+            monthly_reads.append(value)
+        elif metric == "avg_rating":
+            stats.avg_rating = value or 0.0
+        elif metric == "books_read":
+            stats.progress.books_read = value
+        elif metric == "pages_read":
+            stats.progress.pages_read = value
+
+    stats.status_counts = dict(sorted(status_counts, key=lambda item: str(item[0])))
+    stats.genre_counts = dict(sorted(genre_counts, key=lambda item: -item[1]))
+    stats.total_books = sum(stats.status_counts.values())
+
+    # Calculate reading velocity
+    if monthly_reads:
+        stats.reading_velocity = sum(monthly_reads) / len(monthly_reads)
+
+    return stats
+
+# Dashboard aggregates are memoized on the database generation, which the
+# connection pool bumps after every committed write, so a cached result is
+# reused until the library changes and dropped the moment it does
+@st.cache_data(max_entries=8, show_spinner=False)
+def get_cached_reading_stats(generation):
+    return get_reading_stats()
@@ -0,0 +1,497 @@
+from datetime import datetime
+import os
+from io import TextIOWrapper
+import json
+import tempfile
+import zipfile
+from itertools import islice
+from dataclasses import dataclass
+
+from .startup import lazy_import
+from .db import db_connection
+from .dedup import book_isbn_key, book_title_author_key, claim_dedup_keys, refresh_dedup_keys, find_duplicate_book
+from .covers import process_cover, get_cover_pool, cover_path, store_cover
+from .books import BOOK_LIST_COLUMNS
+from .features import refresh_book_features
+
+# Import/Export functions
+# Library archives: a ZIP of newline-delimited JSON records, one file per table,
+# plus each distinct cover image once under covers/. Written row by row from a
+# single read snapshot, so memory use does not grow with the library.
+ARCHIVE_FORMAT = "library-archive"
+ARCHIVE_VERSION = 1
+ARCHIVE_TABLES = {
+    "wishlist": "SELECT * FROM wishlist ORDER BY id",
+    "loans": "SELECT * FROM loans ORDER BY id",
+    "collections": "SELECT * FROM collections ORDER BY id",
+    "reading_history": "SELECT * FROM reading_history ORDER BY id",
+    "reading_goals": "SELECT * FROM reading_goals ORDER BY year",
+}
+
+def archive_cover_name(cover_hash):
+    return f"covers/{cover_hash}.jpg"
+
+def write_ndjson(archive, name, cursor, transform=None):
+    # Write every row of `cursor` to the archive as one JSON object per line; returns the row count
+    columns = [column[0] for column in cursor.description]
+    count = 0
+    with archive.open(name, "w", force_zip64=True) as member:
+        for row in cursor:
+            record = dict(zip(columns, row))
+            if transform:
+                transform(record)
+            member.write(json.dumps(record, ensure_ascii=False).encode("utf-8") + b"\n")
+            count += 1
+    return count
+
+def export_book_record(record):
+    record["collections"] = json.loads(record["collections"])
+    record["cover"] = archive_cover_name(record["cover_hash"]) if record.pop("has_cover") else None
+
+def export_library_archive(path):
+    # Write the whole library to a ZIP archive at `path`
+    counts = {}
+    with db_connection() as conn, zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        # One read transaction so every file comes from the same snapshot
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        counts["books"] = write_ndjson(archive, "books.ndjson", conn.execute(f'''
+        SELECT {BOOK_LIST_COLUMNS},
+               (SELECT json_group_array(c.name)
+                FROM book_collections bc JOIN collections c ON c.id = bc.collection_id
+                WHERE bc.book_id = books.id) AS collections
+        FROM books ORDER BY books.id
+        '''), export_book_record)
+        for table, query in ARCHIVE_TABLES.items():
+            counts[table] = write_ndjson(archive, f"{table}.ndjson", conn.execute(query))
+
+        # Covers are already compressed, so they are stored as they are
+        counts["covers"] = 0
+        for (cover_hash,) in conn.execute("SELECT DISTINCT cover_hash FROM books WHERE cover_hash IS NOT NULL"):
+            name = archive_cover_name(cover_hash)
+            if os.path.exists(cover_path(cover_hash)):
+                archive.write(cover_path(cover_hash), name, compress_type=zipfile.ZIP_STORED)
+            else:
+                cover = conn.execute("SELECT cover_image FROM books WHERE cover_hash = ? AND cover_image IS NOT NULL LIMIT 1",
+                                     (cover_hash,)).fetchone()
+                if cover is None:
+                    continue
+                archive.writestr(name, cover[0], compress_type=zipfile.ZIP_STORED)
+            counts["covers"] += 1
+
+        archive.writestr("manifest.json", json.dumps({
+            "format": ARCHIVE_FORMAT,
+            "version": ARCHIVE_VERSION,
+            "exported_at": datetime.now().isoformat(timespec="seconds"),
+            "counts": counts,
+        }, indent=2))
+    return counts
+
+def iter_archive_books(archive, books_stream):
+    # Yield the book records of an archive's books.ndjson with their cover bytes attached
+    for line in books_stream:
+        if not line.strip():
+            continue
+        book = json.loads(line)
+        if book.get("cover"):
+            try:
+                book["cover_image"] = archive.read(book["cover"])
+            except KeyError:
+                book["cover_image"] = None
+        yield book
+
+IMPORT_READ_SIZE = 1 << 16
+IMPORT_BATCH_SIZE = 1000
+JSON_NUMBER_CHARS = frozenset("0123456789+-.eE")
+
+class JSONStreamReader:
+    # Reads a JSON document from a text stream a chunk at a time, decoding one
+    # value at a time so only the value being decoded is held in memory
+    def __init__(self, stream, read_size=IMPORT_READ_SIZE):
+        self.stream = stream
+        self.read_size = read_size
+        self.decoder = json.JSONDecoder()
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+
+    def _fill(self):
+        # Read at least as much again as is buffered so values spanning many chunks decode in linear time
+        chunk = self.stream.read(max(self.read_size, len(self.buffer) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self):
+        # Next non-whitespace character, or "" at the end of the stream
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in " \t\r\n":
+                self.pos += 1
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char):
+        if self.peek() != char:
+            raise ValueError(f"Malformed import file: expected '{char}'")
+        self.pos += 1
+
+    def skip(self, char):
+        # Consume `char` if it comes next
+        if self.peek() == char:
+            self.pos += 1
+            return True
+        return False
+
+    def value(self):
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                # Incomplete value: read more, or give up at the end of the stream
+                if not self._fill():
+                    raise
+                continue
+            # A number cut off by the end of the buffer ("1." of "1.25") may continue in the next chunk
+            if (end == len(self.buffer) or self.buffer[end] in JSON_NUMBER_CHARS) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+def iter_json_array(stream, key):
+    # Yield the items of the `key` array in a top-level JSON object one at a time.
+    # Other top-level entries are decoded and discarded. Raises KeyError if `key` is missing.
+    reader = JSONStreamReader(stream)
+    reader.expect("{")
+    if not reader.skip("}"):
+        while True:
+            name = reader.value()
+            reader.expect(":")
+            if name == key:
+                reader.expect("[")
+                if not reader.skip("]"):
+                    while True:
+                        yield reader.value()
+                        if not reader.skip(","):
+                            break
+                    reader.expect("]")
+                return
+            reader.value()
+            if not reader.skip(","):
+                break
+    raise KeyError(key)
+
+def book_import_values(book):
+    # Normalize one exported book record to add_book's arguments
+    collections = book.get("collections", [])
+    # Older exports stored collections as a JSON string
+    if isinstance(collections, str):
+        try:
+            collections = json.loads(collections)
+        except ValueError:
+            collections = []
+    if not isinstance(collections, list):
+        collections = []
+    # JSON exports carry a "BINARY_DATA" placeholder rather than cover bytes
+    cover_image = book.get("cover_image")
+    if not isinstance(cover_image, bytes):
+        cover_image = None
+    return dict(
+        title=book.get("title", "Unknown Title"),
+        author=book.get("author", "Unknown Author"),
+        genre=book.get("genre", "Fiction"),
+        status=book.get("status", "To Read"),
+        rating=book.get("rating", 0),
+        notes=book.get("notes", ""),
+        cover_image=cover_image,
+        total_pages=book.get("total_pages", 0),
+        pages_read=book.get("pages_read", 0),
+        isbn=book.get("isbn", ""),
+        publication_year=book.get("publication_year", 2000),
+        publisher=book.get("publisher", ""),
+        collections=collections,
+    )
+
+# How the importer treats a record matching a book already in the library by
+# ISBN or by title and author: None imports it anyway, "skip" drops it and
+# "merge" fills in the existing book's blank fields and adds its collections
+IMPORT_DUPLICATE_MODES = {
+    "Import everything": None,
+    "Skip duplicates": "skip",
+    "Merge into existing books": "merge",
+}
+
+@dataclass
+class ImportResult:
+    imported: int = 0
+    skipped: int = 0
+    merged: int = 0
+
+    @property
+    def processed(self):
+        return self.imported + self.skipped + self.merged
+
+def bulk_import_books(books, batch_size=IMPORT_BATCH_SIZE, on_batch=None, on_duplicate=None):
+    # Insert exported book records in executemany batches inside a single
+    # transaction, so an import pays for one commit instead of one per book.
+    # on_duplicate is one of the IMPORT_DUPLICATE_MODES values; on_batch(processed)
+    # is called after each batch. Returns an ImportResult.
+    date_added = datetime.now().strftime("%Y-%m-%d")
+    books = iter(books)
+    result = ImportResult()
+    # Duplicate keys of the books added so far, which only claim them at the end
+    imported_keys = {}
+    with db_connection() as conn:
+        # Take the write lock up front: book ids are assigned here rather than by
+        # the INSERT so that history and collection rows can be batched too
+        if not conn.in_transaction:
+            conn.execute("BEGIN IMMEDIATE")
+        next_id = conn.execute('''
+        SELECT MAX(IFNULL((SELECT seq FROM sqlite_sequence WHERE name = 'books'), 0),
+                   IFNULL((SELECT MAX(id) FROM books), 0)) + 1
+        ''').fetchone()[0]
+        first_id = next_id
+        collection_ids = {}
+        for collection_id, name in conn.execute("SELECT id, name FROM collections"):
+            collection_ids.setdefault(name, []).append(collection_id)
+
+        while True:
+            batch = list(islice(books, batch_size))
+            if not batch:
+                break
+
+            book_rows, merge_rows, history_rows, membership_rows = [], [], [], []
+            # Convert the batch's covers in parallel while its rows are being built
+            batch = [book_import_values(book) for book in batch]
+            cover_futures = [get_cover_pool().submit(process_cover, values["cover_image"])
+                             if values["cover_image"] else None for values in batch]
+
+            for values, cover_future in zip(batch, cover_futures):
+                if cover_future:
+                    try:
+                        values["cover_image"] = cover_future.result()
+                    except Exception:
+                        # An unreadable cover is dropped rather than failing the import
+                        values["cover_image"] = None
+                cover_hash = store_cover(values["cover_image"]) if values["cover_image"] else None
+
+                isbn_key = book_isbn_key(values["isbn"])
+                title_author_key = book_title_author_key(values["title"], values["author"])
+                if on_duplicate:
+                    duplicate_id = imported_keys.get(isbn_key) or imported_keys.get(title_author_key)
+                    if duplicate_id is None:
+                        duplicate_id = find_duplicate_book(conn, isbn_key, title_author_key)
+                    if duplicate_id is not None:
+                        if on_duplicate == "skip":
+                            result.skipped += 1
+                            continue
+                        merge_rows.append((values["genre"], values["rating"], values["notes"], values["total_pages"],
+                                           values["isbn"], values["publication_year"], values["publisher"],
+                                           values["cover_image"], cover_hash, duplicate_id))
+                        for name in dict.fromkeys(values["collections"]):
+                            membership_rows.extend((duplicate_id, collection_id)
+                                                   for collection_id in collection_ids.get(name, []))
+                        result.merged += 1
+                        continue
+
+                book_id = next_id
+                next_id += 1
+                if on_duplicate:
+                    for key in (isbn_key, title_author_key):
+                        if key:
+                            imported_keys.setdefault(key, book_id)
+
+                book_rows.append((book_id, values["title"], values["author"], values["genre"], values["status"],
+                                  values["rating"], date_added, values["notes"], values["cover_image"], cover_hash,
+                                  values["total_pages"], values["pages_read"], values["isbn"],
+                                  values["publication_year"], values["publisher"], isbn_key, title_author_key))
+                # Same reading history add_book records for the status
+                if values["status"] == "Read":
+                    history_rows.append((book_id, date_added, date_added))
+                elif values["status"] == "Currently Reading":
+                    history_rows.append((book_id, date_added, None))
+                for name in dict.fromkeys(values["collections"]):
+                    membership_rows.extend((book_id, collection_id) for collection_id in collection_ids.get(name, []))
+                result.imported += 1
+
+            conn.executemany('''
+            INSERT INTO books (id, title, author, genre, status, rating, date_added, notes, cover_image, cover_hash,
+                              total_pages, pages_read, isbn, publication_year, publisher, isbn_key, title_author_key)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', book_rows)
+            # Merging only fills in what the existing book is missing
+            conn.executemany('''
+            UPDATE books
+            SET genre = COALESCE(NULLIF(genre, ''), ?),
+                rating = COALESCE(NULLIF(rating, 0), ?),
+                notes = COALESCE(NULLIF(notes, ''), ?),
+                total_pages = COALESCE(NULLIF(total_pages, 0), ?),
+                isbn = COALESCE(NULLIF(isbn, ''), ?),
+                publication_year = COALESCE(publication_year, ?),
+                publisher = COALESCE(NULLIF(publisher, ''), ?),
+                cover_image = COALESCE(cover_image, ?),
+                cover_hash = CASE WHEN cover_image IS NULL THEN ? ELSE cover_hash END
+            WHERE id = ?
+            ''', merge_rows)
+            # A merge can fill in an ISBN, giving the book a new key
+            for merged_id in dict.fromkeys(row[-1] for row in merge_rows):
+                refresh_dedup_keys(conn, merged_id)
+            conn.executemany('''
+            INSERT INTO reading_history (book_id, date_started, date_finished)
+            VALUES (?, ?, ?)
+            ''', history_rows)
+            conn.executemany('''
+            INSERT OR IGNORE INTO book_collections (book_id, collection_id)
+            VALUES (?, ?)
+            ''', membership_rows)
+            refresh_book_features(conn, [row[0] for row in book_rows] + [row[-1] for row in merge_rows])
+
+            if on_batch:
+                on_batch(result.processed)
+
+        claim_dedup_keys(conn, first_id)
+
+    return result
+
+# Columnar snapshots: one Parquet or Arrow IPC file per table, zipped together.
+# pyarrow ships with Streamlit but is slow to import, so it is imported lazily here.
+COLUMNAR_FORMATS = {"parquet": "Parquet", "arrow": "Arrow IPC"}
+COLUMNAR_BATCH_ROWS = 64 * 1024
+COLUMNAR_TABLES = {
+    "books": [("id", "int64"), ("title", "string"), ("author", "string"), ("genre", "string"),
+              ("status", "string"), ("rating", "int64"), ("date_added", "string"), ("notes", "string"),
+              ("total_pages", "int64"), ("pages_read", "int64"), ("isbn", "string"),
+              ("publication_year", "int64"), ("publisher", "string"), ("cover_hash", "string"),
+              ("collections", "list<string>")],
+    "wishlist": [("id", "int64"), ("title", "string"), ("author", "string"), ("priority", "string"),
+                 ("notes", "string"), ("date_added", "string")],
+    "loans": [("id", "int64"), ("book_id", "int64"), ("borrower_name", "string"), ("date_loaned", "string"),
+              ("expected_return_date", "string"), ("returned", "bool")],
+    "reading_history": [("id", "int64"), ("book_id", "int64"), ("date_started", "string"),
+                        ("date_finished", "string")],
+}
+
+def columnar_schema(pa, columns):
+    types = {"int64": pa.int64(), "string": pa.string(), "bool": pa.bool_(), "list<string>": pa.list_(pa.string())}
+    return pa.schema([(column, types[type_name]) for column, type_name in columns])
+
+def columnar_query(table, columns):
+    # SQLite columns can hold any type, so numbers are cast to match the schema
+    expressions = []
+    for column, type_name in columns:
+        if type_name == "list<string>":
+            expressions.append(f'''(SELECT json_group_array(c.name)
+                FROM book_collections bc JOIN collections c ON c.id = bc.collection_id
+                WHERE bc.book_id = {table}.id) AS {column}''')
+        elif type_name in ("int64", "bool"):
+            expressions.append(f"CAST({column} AS INTEGER) AS {column}")
+        else:
+            expressions.append(column)
+    return f"SELECT {', '.join(expressions)} FROM {table} ORDER BY id"
+
+def export_library_columnar(path, file_format):
+    # Write the books, wishlist, loans and reading history tables to a ZIP of
+    # Parquet or Arrow IPC files at `path`, a batch of rows at a time
+    pa = lazy_import("pyarrow")
+    pq = lazy_import("pyarrow.parquet")
+
+    counts = {}
+    with tempfile.TemporaryDirectory() as tmp_dir, db_connection() as conn, \
+            zipfile.ZipFile(path, "w") as archive:
+        # One read transaction so every table comes from the same snapshot
+        if not conn.in_transaction:
+            conn.execute("BEGIN")
+        for table, columns in COLUMNAR_TABLES.items():
+            schema = columnar_schema(pa, columns)
+            table_path = os.path.join(tmp_dir, f"{table}.{file_format}")
+            if file_format == "parquet":
+                writer = pq.ParquetWriter(table_path, schema, compression="zstd")
+            else:
+                writer = pa.ipc.new_file(table_path, schema, options=pa.ipc.IpcWriteOptions(compression="zstd"))
+
+            counts[table] = 0
+            cursor = conn.execute(columnar_query(table, columns))
+            with writer:
+                while rows := cursor.fetchmany(COLUMNAR_BATCH_ROWS):
+                    arrays = []
+                    for (column, type_name), field, values in zip(columns, schema, zip(*rows)):
+                        if type_name == "list<string>":
+                            values = [json.loads(names) for names in values]
+                        elif type_name == "bool":
+                            values = [None if value is None else bool(value) for value in values]
+                        arrays.append(pa.array(values, type=field.type))
+                    writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+                    counts[table] += len(rows)
+
+            # Both formats are compressed internally already
+            archive.write(table_path, f"{table}.{file_format}", compress_type=zipfile.ZIP_STORED)
+    return counts
+
+def open_columnar_books(source, file_format, batch_size=IMPORT_BATCH_SIZE):
+    # Iterator over the book records of a Parquet or Arrow IPC books table, and
+    # a function giving the fraction of them read so far
+    pa = lazy_import("pyarrow")
+    pq = lazy_import("pyarrow.parquet")
+
+    if file_format == "parquet":
+        parquet_file = pq.ParquetFile(source)
+        total = parquet_file.metadata.num_rows
+        batches = parquet_file.iter_batches(batch_size=batch_size)
+        books = (record for batch in batches for record in batch.to_pylist())
+        return books, lambda processed: min(processed / max(total, 1), 1.0)
+
+    # Arrow IPC files carry no row count and counting would decode every batch
+    # an extra time, so progress is the batch index plus the share of the
+    # current batch read so far
+    reader = pa.ipc.open_file(source)
+    position = {"batch": 0, "rows": 0, "batch_rows": 1}
+
+    def records():
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            position.update(batch=i, rows=0, batch_rows=max(batch.num_rows, 1))
+            for record in batch.to_pylist():
+                position["rows"] += 1
+                yield record
+
+    def progress(processed):
+        read = position["batch"] + position["rows"] / position["batch_rows"]
+        return min(read / max(reader.num_record_batches, 1), 1.0)
+
+    return records(), progress
+
+def open_book_import(file_name, source, size):
+    # Book records from an uploaded export, and a function giving the fraction of
+    # them read so far. Raises KeyError when the upload has no books table.
+    extension = os.path.splitext(file_name.lower())[1].lstrip(".")
+    columnar_source = None
+    if extension in COLUMNAR_FORMATS:
+        columnar_source = source, extension
+    elif extension == "zip":
+        archive = zipfile.ZipFile(source)
+        names = set(archive.namelist())
+        columnar_source = next(((archive.open(f"books.{file_format}"), file_format)
+                                for file_format in COLUMNAR_FORMATS if f"books.{file_format}" in names), None)
+
+    if columnar_source:
+        return open_columnar_books(*columnar_source)
+
+    if extension == "zip":
+        books_text = TextIOWrapper(archive.open("books.ndjson"), encoding="utf-8")
+        size = archive.getinfo("books.ndjson").file_size
+        books = iter_archive_books(archive, books_text)
+    else:
+        books_text = TextIOWrapper(source, encoding="utf-8")
+        books = iter_json_array(books_text, "books")
+
+    def progress(processed):
+        # Records are parsed as the file is read, so the read position tracks progress.
+        # Holding books_text here also keeps it from closing the file under it.
+        return min(books_text.buffer.tell() / max(size, 1), 1.0)
+
+    return books, progress
@@ -0,0 +1,23 @@
+import pandas as pd
+from datetime import datetime
+
+from .db import db_connection
+
+# Wishlist operations
+def add_to_wishlist(title, author, priority, notes):
+    with db_connection() as conn:
+        c = conn.cursor()
+        date_added = datetime.now().strftime("%Y-%m-%d")
+
+        c.execute('''
+        INSERT INTO wishlist (title, author, priority, notes, date_added)
+        VALUES (?, ?, ?, ?, ?)
+        ''', (title, author, priority, notes, date_added))
+
+def get_wishlist():
+    with db_connection() as conn:
+        return pd.read_sql_query("SELECT * FROM wishlist", conn)
+
+def delete_from_wishlist(item_id):
+    with db_connection() as conn:
+        conn.execute("DELETE FROM wishlist WHERE id = ?", (item_id,))